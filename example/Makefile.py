@@ -24,7 +24,6 @@ DATABASE = OUTPUT_DIR / "data.db"
 @task(outputs=[RAW_DATA])
 def fetch():
     """Download raw data from API."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     sh(f"echo '{{\"data\": []}}' > {RAW_DATA}")
 
 
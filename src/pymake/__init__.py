@@ -9,8 +9,10 @@ from .executor import (
     MissingOutputError,
     UnproducibleInputError,
 )
+from .fingerprint import FingerprintDB
 from .resolver import CyclicDependencyError, DependencyResolver
 from .sh import sh
+from .statcache import StatCache
 from .task import Task, TaskRegistry, TaskVar, task
 from .vars import VarsResolver
 
@@ -29,6 +31,8 @@ __all__ = [
     "DependencyResolver",
     "CyclicDependencyError",
     "VarsResolver",
+    "StatCache",
+    "FingerprintDB",
     "sh",
     "tree_digest",
     "TreeDigest",
@@ -3,47 +3,142 @@
 from __future__ import annotations
 
 import argparse
+import importlib
+import importlib.machinery
 import os
 import sys
 from pathlib import Path
-from typing import NoReturn
+from typing import TYPE_CHECKING, Any, Final, NoReturn
 
-from ..executor import ExecutionError, MissingOutputError
-from ..task import task
-from .clean import CleanCommand
 from .context import CommandContext
-from .doctor import DoctorCommand
-from .graph import GraphCommand
-from .list_cmd import ListCommand
-from .redo import RedoCommand
-from .run import RunCommand
-from .which import WhichCommand
-
-# Map command names to their handler classes
-COMMANDS = {
-    "list": ListCommand,
-    "graph": GraphCommand,
-    "run": RunCommand,
-    "which": WhichCommand,
-    "redo": RedoCommand,
-    "doctor": DoctorCommand,
-    "clean": CleanCommand,
+
+if TYPE_CHECKING:
+    from ..task import TaskRegistry
+
+# Map command names to (module, class, help); modules are imported on first
+# use. The help text mirrors each command's add_parser() and is used for the
+# stub parsers that list commands in --help without importing them.
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    "list": (".list_cmd", "ListCommand", "List registered tasks"),
+    "graph": (".graph", "GraphCommand", "Generate DOT graph for a target"),
+    "run": (".run", "RunCommand", "Run specified targets"),
+    "which": (".which", "WhichCommand", "Show dependency tree for a task or output"),
+    "redo": (".redo", "RedoCommand", "Force re-run a target and its dependents"),
+    "doctor": (".doctor", "DoctorCommand", "Check for dependency issues"),
+    "clean": (".clean", "CleanCommand", "Clean output files of tasks"),
+}
+
+
+def _load_command(name: str) -> Any:
+    """Import and return the handler class for a command name."""
+    module_name, class_name, _ = COMMANDS[name]
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
+# Base options that consume the following argv token as their value
+_VALUE_OPTS: Final[frozenset[str]] = frozenset(
+    {"-f", "--file", "-C", "--directory", "-j", "--jobs", "--vars-file", "--vars"}
+)
+
+# Target mode's base flags by spelling -> Namespace attribute, for the
+# hand-rolled parser below
+_VALUE_DESTS: Final[dict[str, str]] = {
+    "-f": "file",
+    "--file": "file",
+    "-C": "directory",
+    "--directory": "directory",
+    "-j": "jobs",
+    "--jobs": "jobs",
+    "--vars-file": "vars_file",
+    "--vars": "vars",
+}
+_FLAG_DESTS: Final[dict[str, str]] = {
+    "-p": "parallel",
+    "--parallel": "parallel",
+    "-B": "force",
+    "--force": "force",
+    "-q": "quiet",
+    "--quiet": "quiet",
+    "--content-hash": "content_hash",
 }
 
 
+def _fast_parse_target_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse ``[options] target...`` without building an ArgumentParser.
+
+    Produces the same Namespace the target-mode argparse parser would.
+    Returns None for anything beyond the plain form (inline ``--opt=value``,
+    bundled short flags, unknown options, ``-h``, options after the first
+    target, a bad ``-j`` value), leaving argparse to handle or report it.
+    """
+    values: dict[str, Any] = {
+        "file": "Makefile.py",
+        "directory": None,
+        "jobs": None,
+        "parallel": False,
+        "force": False,
+        "quiet": False,
+        "content_hash": False,
+        "vars_file": os.environ.get("PYMAKE_VARS_FILE"),
+        "vars": [],
+    }
+    i = 0
+    n = len(argv)
+    while i < n and argv[i].startswith("-"):
+        arg = argv[i]
+        dest = _FLAG_DESTS.get(arg)
+        if dest is not None:
+            values[dest] = True
+            i += 1
+            continue
+        dest = _VALUE_DESTS.get(arg)
+        if dest is None or i + 1 == n or argv[i + 1].startswith("-"):
+            return None
+        value = argv[i + 1]
+        if dest == "jobs":
+            try:
+                values[dest] = int(value)
+            except ValueError:
+                return None
+        elif dest == "vars":
+            values[dest].append(value)
+        else:
+            values[dest] = value
+        i += 2
+
+    targets = argv[i:]
+    if not targets or any(t.startswith("-") for t in targets):
+        return None
+    return argparse.Namespace(**values, targets=targets)
+
+
 class CLI:
     """Command-line interface handler for pymake."""
 
-    SUBCOMMANDS = {"list", "graph", "run", "which", "redo", "doctor", "clean", "help"}
+    SUBCOMMANDS: Final[frozenset[str]] = frozenset(
+        {"list", "graph", "run", "which", "redo", "doctor", "clean", "help"}
+    )
 
     def __init__(self, argv: list[str] | None = None) -> None:
         self.argv = argv if argv is not None else sys.argv[1:]
-        self.registry = task
+        self._registry: TaskRegistry | None = None
         self.parser: argparse.ArgumentParser | None = None
         self.args: argparse.Namespace | None = None
 
+    @property
+    def registry(self) -> TaskRegistry:
+        """The global task registry, imported on first use."""
+        if self._registry is None:
+            from ..task import task
+
+            self._registry = task
+        return self._registry
+
     def run(self) -> NoReturn:
         """Main entry point - parse args and dispatch to appropriate command."""
+        if self.argv in (["help"], ["-h"], ["--help"]):
+            self._print_help()
+
         try:
             if self._is_force_subcommand_mode():
                 self._run_subcommand_mode()
@@ -51,7 +146,11 @@ class CLI:
                 self._run_target_mode()
             else:
                 self._run_subcommand_mode()
-        except (MissingOutputError, ExecutionError, ValueError) as e:
+        except Exception as e:
+            from ..executor import ExecutionError, MissingOutputError
+
+            if not isinstance(e, (MissingOutputError, ExecutionError, ValueError)):
+                raise
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -62,25 +161,26 @@ class CLI:
             return True
         return False
 
+    def _first_positional(self) -> str | None:
+        """Return the first positional arg, skipping values of base options.
+
+        ``--file=x`` and ``-fx`` carry their value inline, so only a bare
+        option from _VALUE_OPTS consumes the next token.
+        """
+        skip = False
+        for arg in self.argv:
+            if skip:
+                skip = False
+            elif arg in _VALUE_OPTS:
+                skip = True
+            elif not arg.startswith("-"):
+                return arg
+        return None
+
     def _is_target_mode(self) -> bool:
         """Check if first positional arg is a target (not a subcommand)."""
-        for i, arg in enumerate(self.argv):
-            if not arg.startswith("-"):
-                # Skip value for options that take arguments
-                prev = self.argv[i - 1] if i > 0 else ""
-                if prev in (
-                    "-f",
-                    "--file",
-                    "-C",
-                    "--directory",
-                    "-j",
-                    "--jobs",
-                    "--vars-file",
-                    "--vars",
-                ):
-                    continue
-                return arg not in self.SUBCOMMANDS
-        return False
+        arg = self._first_positional()
+        return arg is not None and arg not in self.SUBCOMMANDS
 
     def _build_base_parser(self) -> argparse.ArgumentParser:
         """Build the base argument parser with common options."""
@@ -125,6 +225,14 @@ class CLI:
             action="store_true",
             help="Quiet mode (suppress output)",
         )
+        parser.add_argument(
+            "--content-hash",
+            action="store_true",
+            help=(
+                "Skip tasks whose inputs are newer but byte-identical "
+                "(fingerprints kept in .pymake/fingerprints.json)"
+            ),
+        )
         parser.add_argument(
             "--vars-file",
             default=os.environ.get("PYMAKE_VARS_FILE"),
@@ -137,22 +245,44 @@ class CLI:
             metavar="KEY=VALUE",
             help=(
                 "Override task vars; supports task.var=value and "
-                "task={\"json\": ...}. Repeatable."
+                'task={"json": ...}. Repeatable.'
             ),
         )
         return parser
 
     def _add_subparsers(self, parser: argparse.ArgumentParser) -> None:
-        """Add subcommand parsers."""
+        """Add subcommand parsers.
+
+        Only the command named on the command line gets its real parser.
+        The others get help-only stubs when they might be listed (no or
+        unknown command, ``help``, or ``-h``), so help output is unchanged.
+        """
         subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-        # Add arguments from each command class
-        for command_cls in COMMANDS.values():
-            command_cls.add_arguments(subparsers)
+        selected = self._first_positional()
+        want_stubs = selected not in COMMANDS or any(
+            arg in ("-h", "--help") for arg in self.argv
+        )
+        for name, (_, _, help_text) in COMMANDS.items():
+            if name == selected:
+                _load_command(name).add_arguments(subparsers)
+            elif want_stubs:
+                subparsers.add_parser(name, help=help_text)
 
         # help command (simple, no class needed)
         subparsers.add_parser("help", help="Show help")
 
+    def _print_help(self) -> NoReturn:
+        """Print top-level help without touching Makefile.py or -C.
+
+        Command names come from stub subparsers, so no command module is
+        imported.
+        """
+        self.parser = self._build_base_parser()
+        self._add_subparsers(self.parser)
+        self.parser.print_help()
+        sys.exit(0)
+
     def _change_directory(self) -> None:
         """Change to the specified directory if -C was given."""
         assert self.args is not None
@@ -173,7 +303,6 @@ class CLI:
             print(f"Error: {path} not found", file=sys.stderr)
             sys.exit(1)
 
-        code = path.read_text()
         globals_dict = {
             "__name__": "__main__",
             "__file__": str(path.resolve()),
@@ -185,24 +314,34 @@ class CLI:
             sys.path.insert(0, makefile_dir)
 
         try:
-            exec(compile(code, path, "exec"), globals_dict)
+            # SourceFileLoader reuses __pycache__ bytecode when the source
+            # is unchanged, so warm runs skip parsing and compiling
+            loader = importlib.machinery.SourceFileLoader("__main__", str(path))
+            code = loader.get_code("__main__")
+            assert code is not None
+            exec(code, globals_dict)
         except Exception as e:
             print(f"Error loading {path}: {e}", file=sys.stderr)
             sys.exit(1)
 
     def _run_target_mode(self) -> NoReturn:
         """Handle direct target execution (e.g., `pymake build`)."""
-        self.parser = self._build_base_parser()
-        self.parser.add_argument("targets", nargs="+", help="Targets to run")
-        self.args = self.parser.parse_args(self.argv)
+        fast_args = _fast_parse_target_args(self.argv)
+        if fast_args is not None:
+            self.args = fast_args
+        else:
+            self.parser = self._build_base_parser()
+            self.parser.add_argument("targets", nargs="+", help="Targets to run")
+            self.args = self.parser.parse_args(self.argv)
 
         self._change_directory()
         self.registry.clear()
         self._load_makefile()
+        self.registry.finalize()
 
         # Use RunCommand for target mode
         ctx = CommandContext(self.registry, self.args)
-        RunCommand(ctx).execute()
+        _load_command("run")(ctx).execute()
         sys.exit(0)
 
     def _run_subcommand_mode(self) -> NoReturn:
@@ -213,9 +352,20 @@ class CLI:
 
         self._change_directory()
         self.registry.clear()
-        self._load_makefile()
+        if self._needs_makefile(self.args.command):
+            self._load_makefile()
+            self.registry.finalize()
         self._dispatch_command()
 
+    @staticmethod
+    def _needs_makefile(command: str | None) -> bool:
+        """Whether a subcommand needs Makefile.py (no command = default task)."""
+        if command == "help":
+            return False
+        if command in COMMANDS:
+            return bool(_load_command(command).REQUIRES_MAKEFILE)
+        return True
+
     def _dispatch_command(self) -> NoReturn:
         """Dispatch to the appropriate command handler."""
         assert self.args is not None
@@ -225,9 +375,8 @@ class CLI:
         ctx = CommandContext(self.registry, self.args)
 
         # Look up command class in dispatch table
-        command_cls = COMMANDS.get(command)
-        if command_cls:
-            command_cls(ctx).execute()
+        if command in COMMANDS:
+            _load_command(command)(ctx).execute()
         elif command == "help":
             self.parser.print_help()
         else:
@@ -236,7 +385,7 @@ class CLI:
             if default_target:
                 # Create args with targets for RunCommand
                 self.args.targets = [default_target]
-                RunCommand(ctx).execute()
+                _load_command("run")(ctx).execute()
             else:
                 self.parser.print_help()
 
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ..task import Task
 from .context import CommandContext
 
+_PARALLEL_UNLINK_MIN = 8
+
 
 class CleanCommand:
     """Clean output files of tasks."""
 
+    REQUIRES_MAKEFILE = True
+
     def __init__(self, ctx: CommandContext) -> None:
         self.ctx = ctx
 
@@ -67,12 +74,12 @@ class CleanCommand:
             sys.exit(1)
 
         # Collect files to clean
-        files_to_clean: set[Path] = set()
+        files_to_clean: list[Path] = []
 
         if clean_all:
             # Clean all output files from all tasks
-            for task in self.ctx.registry.all_tasks():
-                files_to_clean.update(task.outputs)
+            for task in self.ctx.all_tasks:
+                files_to_clean.extend(task.outputs)
         else:
             # Find the target task
             found_task = self.ctx.find_target(target)
@@ -96,23 +103,102 @@ class CleanCommand:
 
             # Collect output files
             for task in tasks_to_clean:
-                files_to_clean.update(task.outputs)
+                files_to_clean.extend(task.outputs)
+
+        # The registry already rejects shared outputs; this only guards
+        # against unlinking the same path twice
+        files_to_clean = list(dict.fromkeys(files_to_clean))
 
         # Filter to only existing files
-        existing_files = sorted(f for f in files_to_clean if f.exists())
+        existing_files = sorted(_existing(files_to_clean))
 
         if not existing_files:
-            self.ctx.console.print("Nothing to clean.")
+            if self.ctx.verbose:
+                self.ctx.console.print("Nothing to clean.")
             return
 
-        # Perform cleaning
+        # Perform cleaning. Output is rendered in one print call, since rich
+        # pays markup/render overhead per call. A dry run always reports
+        # (that's its point); real deletions are silent under --quiet.
         if dry_run:
-            self.ctx.console.print("[dim]Dry run - would delete:[/dim]")
-            for f in existing_files:
-                self.ctx.console.print(f"  {f}")
-            self.ctx.console.print(f"\n[dim]{len(existing_files)} file(s) would be deleted[/dim]")
+            lines = ["[dim]Dry run - would delete:[/dim]"]
+            lines.extend(f"  {f}" for f in existing_files)
+            lines.append(f"\n[dim]{len(existing_files)} file(s) would be deleted[/dim]")
+            self.ctx.console.print("\n".join(lines))
         else:
-            for f in existing_files:
-                f.unlink()
-                self.ctx.console.print(f"[red]deleted[/red] {f}")
-            self.ctx.console.print(f"\n{len(existing_files)} file(s) deleted")
+            deleted, error = _unlink_all(existing_files)
+            # Report what is gone even if a later unlink failed
+            if self.ctx.verbose and deleted:
+                lines = [f"[red]deleted[/red] {f}" for f in deleted]
+                lines.append(f"\n{len(deleted)} file(s) deleted")
+                self.ctx.console.print("\n".join(lines))
+            if error is not None:
+                raise error
+
+
+def _unlink_all(files: list[Path]) -> tuple[list[Path], OSError | None]:
+    """Delete *files*, overlapping the syscalls on a thread pool for big batches.
+
+    Returns the files deleted and the first failure, if any. Small batches
+    stop at the first failure; a pool's workers are already under way, so
+    there every file is attempted. unlink releases the GIL, so threads help
+    once there are more than ``_PARALLEL_UNLINK_MIN`` files; smaller batches
+    aren't worth the startup.
+    """
+    deleted: list[Path] = []
+    if len(files) <= _PARALLEL_UNLINK_MIN:
+        for f in files:
+            try:
+                os.unlink(f)
+            except OSError as e:
+                return deleted, e
+            deleted.append(f)
+        return deleted, None
+
+    def unlink(f: Path) -> OSError | None:
+        try:
+            os.unlink(f)
+        except OSError as e:
+            return e
+        return None
+
+    first_error: OSError | None = None
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+        for f, error in zip(files, pool.map(unlink, files)):
+            if error is None:
+                deleted.append(f)
+            elif first_error is None:
+                first_error = error
+    return deleted, first_error
+
+
+def _existing(files: Iterable[Path]) -> list[Path]:
+    """Return the files that exist, listing each shared parent only once.
+
+    Parents holding several candidates are read with one ``os.scandir``
+    instead of one stat per file. Names the listing doesn't show are
+    double-checked with a stat, so case-insensitive filesystems still work.
+    Symlinks are followed, as with ``Path.exists()``: dangling ones are left.
+    """
+    by_parent: dict[Path, dict[str, Path]] = {}
+    for f in files:
+        by_parent.setdefault(f.parent, {})[f.name] = f
+
+    existing: list[Path] = []
+    for parent, wanted in by_parent.items():
+        if len(wanted) > 1:
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        found = wanted.pop(entry.name, None)
+                        # Like Path.exists(), a dangling symlink doesn't count
+                        if found is not None and (
+                            not entry.is_symlink() or os.path.exists(found)
+                        ):
+                            existing.append(found)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                pass
+        existing.extend(f for f in wanted.values() if os.path.exists(f))
+    return existing
@@ -0,0 +1,108 @@
+"""Tests for clean command."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import pytest
+
+from ..task import TaskRegistry
+from .clean import CleanCommand, _existing
+from .context import CommandContext
+
+
+def test_existing_batches_siblings_and_checks_singletons(tmp_path: Path) -> None:
+    build = tmp_path / "build"
+    build.mkdir()
+    (build / "a.txt").write_text("a")
+    (build / "b.txt").write_text("b")
+    (tmp_path / "solo.txt").write_text("s")
+
+    files = {
+        build / "a.txt",
+        build / "b.txt",
+        build / "missing.txt",
+        tmp_path / "solo.txt",
+        tmp_path / "gone" / "x.txt",
+        tmp_path / "gone" / "y.txt",
+    }
+    assert sorted(_existing(files)) == [
+        build / "a.txt",
+        build / "b.txt",
+        tmp_path / "solo.txt",
+    ]
+
+
+def test_existing_skips_dangling_symlinks(tmp_path: Path) -> None:
+    (tmp_path / "target.txt").write_text("t")
+    (tmp_path / "live").symlink_to(tmp_path / "target.txt")
+    (tmp_path / "dangling").symlink_to(tmp_path / "nowhere")
+    (tmp_path / "solo").mkdir()
+    (tmp_path / "solo" / "dangling").symlink_to(tmp_path / "nowhere")
+
+    files = [tmp_path / "live", tmp_path / "dangling", tmp_path / "solo" / "dangling"]
+    assert _existing(files) == [tmp_path / "live"]
+
+
+def _clean_args(**overrides: object) -> argparse.Namespace:
+    args = dict(target="build", all_tasks=False, up=False, down=False, dry=False)
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def test_clean_quiet_deletes_silently(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    out = tmp_path / "out.txt"
+    out.write_text("x")
+    registry = TaskRegistry()
+    registry.register(lambda: None, name="build", outputs=[out])
+
+    CleanCommand(CommandContext(registry, _clean_args(quiet=True))).execute()
+    assert not out.exists()
+    assert capsys.readouterr().out == ""
+
+
+def test_clean_dry_run_reports_in_quiet_mode(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    out = tmp_path / "out.txt"
+    out.write_text("x")
+    registry = TaskRegistry()
+    registry.register(lambda: None, name="build", outputs=[out])
+
+    CleanCommand(CommandContext(registry, _clean_args(dry=True, quiet=True))).execute()
+    assert out.exists()
+    assert "1 file(s) would be deleted" in capsys.readouterr().out
+
+
+def test_clean_all_deletes_large_batch(tmp_path: Path) -> None:
+    outs = [tmp_path / f"out{i}.txt" for i in range(20)]
+    registry = TaskRegistry()
+    for i, out in enumerate(outs):
+        out.write_text("x")
+        registry.register(lambda: None, name=f"t{i}", outputs=[out])
+
+    args = _clean_args(target=None, all_tasks=True, quiet=True)
+    CleanCommand(CommandContext(registry, args)).execute()
+    assert not any(out.exists() for out in outs)
+
+
+def test_clean_reports_deleted_files_before_raising(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    outs = [tmp_path / f"out{i}.txt" for i in range(20)]
+    registry = TaskRegistry()
+    for i, out in enumerate(outs):
+        registry.register(lambda: None, name=f"t{i}", outputs=[out])
+        out.write_text("x")
+    # unlink refuses directories, so this one fails mid-batch
+    outs[5].unlink()
+    outs[5].mkdir()
+
+    args = _clean_args(target=None, all_tasks=True)
+    with pytest.raises(OSError):
+        CleanCommand(CommandContext(registry, args)).execute()
+    assert [out for out in outs if out.exists()] == [outs[5]]
+    assert "19 file(s) deleted" in capsys.readouterr().out
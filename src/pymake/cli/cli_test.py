@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from . import CLI
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+from . import CLI, _fast_parse_target_args
 
 
 def test_is_target_mode_skips_vars_value() -> None:
@@ -13,3 +19,108 @@ def test_is_target_mode_skips_vars_value() -> None:
 def test_is_target_mode_skips_vars_file_value() -> None:
     cli = CLI(["--vars-file", "prod.toml", "list"])
     assert cli._is_target_mode() is False
+
+
+def _subcommands(cli: CLI) -> list[str]:
+    parser = cli._build_base_parser()
+    cli._add_subparsers(parser)
+    action = next(a for a in parser._actions if a.dest == "command")
+    assert action.choices is not None
+    return list(action.choices)
+
+
+def test_add_subparsers_only_selected_command() -> None:
+    assert _subcommands(CLI(["-f", "other.py", "list"])) == ["list", "help"]
+
+
+def test_add_subparsers_stubs_for_help() -> None:
+    names = _subcommands(CLI(["--help"]))
+    assert names == ["list", "graph", "run", "which", "redo", "doctor", "clean", "help"]
+
+
+def test_help_does_not_need_makefile() -> None:
+    assert CLI._needs_makefile("help") is False
+    assert CLI._needs_makefile("list") is True
+    assert CLI._needs_makefile(None) is True
+
+
+def test_is_target_mode_inline_option_values() -> None:
+    assert CLI(["--file=other.py", "list"])._is_target_mode() is False
+    assert CLI(["-fother.py", "-j4", "build"])._is_target_mode() is True
+    assert CLI(["-f", "list", "build"])._is_target_mode() is True
+
+
+def test_help_fast_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # No Makefile.py in cwd: the fast path must not try to load one
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as exc:
+        CLI(["help"]).run()
+    assert exc.value.code == 0
+    assert "{list,graph,run,which,redo,doctor,clean,help}" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["build"],
+        ["-B", "-q", "build", "test"],
+        [
+            "-f",
+            "other.py",
+            "-C",
+            "sub",
+            "-j",
+            "4",
+            "--vars",
+            "a=1",
+            "--vars",
+            "b=2",
+            "x",
+        ],
+        ["--content-hash", "-p", "--vars-file", "v.toml", "out/file.txt"],
+    ],
+)
+def test_fast_parse_target_args_matches_argparse(argv: list[str]) -> None:
+    parser = CLI(argv)._build_base_parser()
+    parser.add_argument("targets", nargs="+")
+    assert _fast_parse_target_args(argv) == parser.parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--file=other.py", "build"],
+        ["-Bq", "build"],
+        ["-j", "many", "build"],
+        ["build", "-B"],
+        ["--unknown", "build"],
+        ["-h", "build"],
+        ["-f"],
+    ],
+)
+def test_fast_parse_target_args_defers_to_argparse(argv: list[str]) -> None:
+    assert _fast_parse_target_args(argv) is None
+
+
+def test_load_makefile_reinserts_dir_after_sys_path_restored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    makefile = tmp_path / "Makefile.py"
+    makefile.write_text("")
+    cli = CLI([])
+    cli.args = argparse.Namespace(file=str(makefile))
+    makefile_dir = str(tmp_path.resolve())
+
+    with monkeypatch.context() as m:
+        m.setattr(sys, "path", list(sys.path))
+        cli._load_makefile()
+        assert makefile_dir in sys.path
+    assert makefile_dir not in sys.path
+
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    cli._load_makefile()
+    assert makefile_dir in sys.path
@@ -6,16 +6,16 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from rich.console import Console
-
-from ..doctor import Doctor
-from ..resolver import DependencyResolver
-from ..task import Task, TaskRegistry
-from ..vars import VarsResolver
-
 if TYPE_CHECKING:
     import argparse
 
+    from rich.console import Console
+
+    from ..fingerprint import FingerprintDB
+    from ..resolver import DependencyResolver
+    from ..task import Task, TaskRegistry
+    from ..vars import VarsResolver
+
 
 class CommandContext:
     """Shared context for CLI commands.
@@ -31,31 +31,58 @@ class CommandContext:
     ) -> None:
         self.registry = registry
         self.args = args
-        self.console = Console()
+        # Read once; commands consult these per task
+        self.parallel: bool = bool(
+            getattr(args, "parallel", False) or getattr(args, "jobs", None) is not None
+        )
+        self.verbose: bool = not getattr(args, "quiet", False)
+        self._console: Console | None = None
         self._resolver: DependencyResolver | None = None
+        self._resolver_version = -1
         self._vars_resolver: VarsResolver | None = None
+        self._fingerprints: FingerprintDB | None = None
+        self._all_tasks: list[Task] | None = None
+        self._all_tasks_version = -1
+
+    @property
+    def console(self) -> Console:
+        """Lazily create the rich console (rich is slow to import)."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
 
     @property
     def resolver(self) -> DependencyResolver:
-        """Lazily create and cache the dependency resolver."""
-        if self._resolver is None:
+        """Lazily create and cache the dependency resolver.
+
+        Rebuilt if the registry has changed since the resolver was created.
+        """
+        if self._resolver is None or self._resolver_version != self.registry.version:
+            from ..resolver import DependencyResolver
+
             self._resolver = DependencyResolver(self.registry)
+            self._resolver_version = self.registry.version
         return self._resolver
 
     @property
-    def parallel(self) -> bool:
-        """Whether to run tasks in parallel."""
-        return getattr(self.args, "parallel", False) or self.args.jobs is not None
+    def all_tasks(self) -> list[Task]:
+        """All registered tasks, listed once per registry version.
 
-    @property
-    def verbose(self) -> bool:
-        """Whether to show verbose output."""
-        return not getattr(self.args, "quiet", False)
+        The list is shared between callers; don't mutate it.
+        """
+        if self._all_tasks is None or self._all_tasks_version != self.registry.version:
+            self._all_tasks = self.registry.all_tasks()
+            self._all_tasks_version = self.registry.version
+        return self._all_tasks
 
     @property
     def vars_resolver(self) -> VarsResolver:
         """Lazily create and cache vars resolver."""
         if self._vars_resolver is None:
+            from ..vars import VarsResolver
+
             raw_vars_file = getattr(self.args, "vars_file", None)
             vars_file = Path(raw_vars_file) if raw_vars_file else None
             vars_overrides = list(getattr(self.args, "vars", []) or [])
@@ -65,14 +92,36 @@ class CommandContext:
             )
         return self._vars_resolver
 
+    @property
+    def fingerprints(self) -> FingerprintDB | None:
+        """Fingerprint database if --content-hash was given or one exists.
+
+        Without --content-hash an existing database is opened with
+        ``check=False``, so tasks that run forget their stale records.
+        """
+        if self._fingerprints is None:
+            from ..fingerprint import DEFAULT_FINGERPRINT_PATH, FingerprintDB
+
+            if getattr(self.args, "content_hash", False):
+                self._fingerprints = FingerprintDB()
+            elif DEFAULT_FINGERPRINT_PATH.exists():
+                self._fingerprints = FingerprintDB(check=False)
+        return self._fingerprints
+
     def find_target(self, target: str) -> Task:
         """Find target by name or output file, raising ValueError if not found."""
         return self.registry.find_target_or_raise(target)
 
     def check_before_run(self, target: Task) -> None:
         """Run doctor check before execution. Exit if issues found."""
-        doctor = Doctor(self.registry)
-        issues = doctor.check_all(target)
+        self.check_before_run_many([target])
+
+    def check_before_run_many(self, targets: list[Task]) -> None:
+        """Run one doctor check over several targets. Exit if issues found."""
+        from ..doctor import Doctor
+
+        doctor = Doctor(self.registry, self.resolver)
+        issues = doctor.check_targets(targets)
         if issues:
             for issue in issues:
                 self.console.print(f"[red]error[/red]: {issue.task}: {issue.message}")
@@ -1,6 +1,7 @@
 """Tests for CommandContext."""
 
 import argparse
+from pathlib import Path
 
 import pytest
 
@@ -41,6 +42,33 @@ class TestCommandContext:
         resolver2 = ctx.resolver
         assert resolver1 is resolver2
 
+    def test_resolver_rebuilt_after_registry_change(self) -> None:
+        """Test resolver is rebuilt when tasks are registered."""
+        registry = TaskRegistry()
+        args = argparse.Namespace()
+        ctx = CommandContext(registry, args)
+
+        resolver1 = ctx.resolver
+        registry.register(lambda: None, name="late")
+        assert ctx.resolver is not resolver1
+
+    def test_all_tasks_cached_per_registry_version(self) -> None:
+        """Test all_tasks is reused until the registry changes."""
+        registry = TaskRegistry()
+        ctx = CommandContext(registry, argparse.Namespace())
+
+        registry.register(lambda: None, name="build")
+        first = ctx.all_tasks
+        assert ctx.all_tasks is first
+        registry.register(lambda: None, name="test")
+        assert [t.name for t in ctx.all_tasks] == ["build", "test"]
+
+    def test_console_created_lazily(self) -> None:
+        """Test console is only created on first access."""
+        ctx = CommandContext(TaskRegistry(), argparse.Namespace())
+        assert ctx._console is None
+        assert ctx.console is ctx.console
+
     def test_parallel_with_jobs(self) -> None:
         """Test parallel is True when jobs is set."""
         registry = TaskRegistry()
@@ -96,6 +124,22 @@ class TestCommandContext:
         # Should not raise or exit
         ctx.check_before_run(task)
 
+    def test_check_before_run_many_reports_shared_issue_once(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test targets sharing a broken dependency get one combined report."""
+        registry = TaskRegistry()
+        registry.register(
+            lambda: None, name="gen", inputs=["/nonexistent/in"], outputs=["g.txt"]
+        )
+        a = registry.register(lambda: None, name="a", inputs=["g.txt"])
+        b = registry.register(lambda: None, name="b", inputs=["g.txt"])
+        ctx = CommandContext(registry, argparse.Namespace())
+
+        with pytest.raises(SystemExit):
+            ctx.check_before_run_many([a, b])
+        assert "1 error(s)" in capsys.readouterr().out
+
     def test_vars_resolver_cached(self) -> None:
         """Test vars_resolver is lazily created and cached."""
         registry = TaskRegistry()
@@ -107,3 +151,21 @@ class TestCommandContext:
 
         assert resolver1 is resolver2
         assert resolver1.vars_overrides == ["build.port=2"]
+
+    def test_fingerprints_forget_only_without_content_hash(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an existing database is opened check=False without the flag."""
+        monkeypatch.chdir(tmp_path)
+        registry = TaskRegistry()
+        ctx = CommandContext(registry, argparse.Namespace(content_hash=False))
+        assert ctx.fingerprints is None
+
+        (tmp_path / ".pymake").mkdir()
+        (tmp_path / ".pymake" / "fingerprints.json").write_text("{}")
+        db = ctx.fingerprints
+        assert db is not None and db.check is False
+
+        ctx = CommandContext(registry, argparse.Namespace(content_hash=True))
+        db = ctx.fingerprints
+        assert db is not None and db.check is True
@@ -5,13 +5,15 @@ from __future__ import annotations
 import argparse
 import sys
 
-from ..doctor import Doctor
+from ..doctor import Doctor, Issue
 from .context import CommandContext
 
 
 class DoctorCommand:
     """Check for dependency issues."""
 
+    REQUIRES_MAKEFILE = True
+
     def __init__(self, ctx: CommandContext) -> None:
         self.ctx = ctx
 
@@ -39,25 +41,29 @@ class DoctorCommand:
             self.ctx.console.print("[green]No issues found.[/green]")
             return
 
-        # Group by severity
-        errors = [i for i in issues if i.severity == "error"]
-        warnings = [i for i in issues if i.severity == "warning"]
-
-        for issue in errors:
-            self.ctx.console.print(f"[red]error[/red]: {issue.task}: {issue.message}")
+        # Group by severity in one pass
+        errors: list[Issue] = []
+        warnings: list[Issue] = []
+        for issue in issues:
+            if issue.severity == "error":
+                errors.append(issue)
+            elif issue.severity == "warning":
+                warnings.append(issue)
 
-        for issue in warnings:
-            self.ctx.console.print(
-                f"[yellow]warning[/yellow]: {issue.task}: {issue.message}"
-            )
-
-        self.ctx.console.print()
+        # One console.print for the whole report; rich has per-call overhead
+        lines = [f"[red]error[/red]: {i.task}: {i.message}" for i in errors]
+        lines.extend(
+            f"[yellow]warning[/yellow]: {i.task}: {i.message}" for i in warnings
+        )
+        lines.append("")
         if errors:
-            self.ctx.console.print(f"[red]{len(errors)} error(s)[/red]", end="")
+            summary = f"[red]{len(errors)} error(s)[/red]"
             if warnings:
-                self.ctx.console.print(f", [yellow]{len(warnings)} warning(s)[/yellow]")
-            else:
-                self.ctx.console.print()
-            sys.exit(1)
+                summary += f", [yellow]{len(warnings)} warning(s)[/yellow]"
         else:
-            self.ctx.console.print(f"[yellow]{len(warnings)} warning(s)[/yellow]")
+            summary = f"[yellow]{len(warnings)} warning(s)[/yellow]"
+        lines.append(summary)
+        self.ctx.console.print("\n".join(lines))
+
+        if errors:
+            sys.exit(1)
@@ -10,6 +10,8 @@ from .context import CommandContext
 class GraphCommand:
     """Generate DOT graph for a target."""
 
+    REQUIRES_MAKEFILE = True
+
     def __init__(self, ctx: CommandContext) -> None:
         self.ctx = ctx
 
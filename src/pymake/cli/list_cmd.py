@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
+import sys
+from collections.abc import Callable
+from operator import attrgetter, itemgetter
+from pathlib import Path, PosixPath, WindowsPath
+from typing import Any
 
-from ..task import TaskVar
+from ..task import Task, TaskVar
 from .context import CommandContext
 
 
 class ListCommand:
     """List registered tasks."""
 
+    REQUIRES_MAKEFILE = True
+
     def __init__(self, ctx: CommandContext) -> None:
         self.ctx = ctx
 
@@ -29,61 +35,91 @@ class ListCommand:
 
     def execute(self) -> None:
         """List registered tasks."""
-        tasks = self.ctx.registry.all_tasks()
+        tasks = self.ctx.all_tasks
 
         if not tasks:
             print("No tasks registered.")
             return
 
-        # Separate named tasks (from decorator) and dynamic tasks
-        named = []
-        dynamic = []
+        default_name = self.ctx.registry.default_task()
+
+        # Separate named tasks (from decorator) and dynamic tasks in one
+        # pass, keying named ones so the default sorts first with plain
+        # tuple comparison
+        named: list[tuple[bool, str, Task]] = []
+        dynamic: list[Task] = []
 
         for t in tasks:
             # Heuristic: tasks with ':' or '/' in name are likely dynamic
             if ":" in t.name or "/" in t.name:
                 dynamic.append(t)
             else:
-                named.append(t)
-
-        default_name = self.ctx.registry.default_task()
+                named.append((t.name != default_name, t.name, t))
 
+        # Build the whole listing and write it once rather than per line
+        lines: list[str] = []
         if named:
-            print("Tasks:")
-            # Sort with default task first
-            sorted_named = sorted(named, key=lambda x: (x.name != default_name, x.name))
-            for t in sorted_named:
+            lines.append("Tasks:")
+            named.sort(key=itemgetter(0, 1))
+            for is_other, _, t in named:
                 doc = f" - {t.doc}" if t.doc else ""
-                default_marker = " (default)" if t.name == default_name else ""
-                print(f"  {t.name}{default_marker}{doc}")
+                default_marker = "" if is_other else " (default)"
+                lines.append(f"  {t.name}{default_marker}{doc}")
                 if t.vars:
-                    formatted_vars = ", ".join(self._format_var(v) for v in t.vars)
-                    print(f"             vars: {formatted_vars}")
+                    lines.append(f"             vars: {_format_vars(t.vars)}")
 
         if self.ctx.args.all_tasks and dynamic:
-            print("\nDynamic tasks:")
-            for t in sorted(dynamic, key=lambda x: x.name):
+            lines.append("\nDynamic tasks:")
+            dynamic.sort(key=attrgetter("name"))
+            for t in dynamic:
                 doc = f" - {t.doc}" if t.doc else ""
-                print(f"  {t.name}{doc}")
+                lines.append(f"  {t.name}{doc}")
                 if t.vars:
-                    formatted_vars = ", ".join(self._format_var(v) for v in t.vars)
-                    print(f"             vars: {formatted_vars}")
-
-    def _format_var(self, var: TaskVar) -> str:
-        type_label = var.type.__name__
-        if var.is_optional:
-            type_label = f"{type_label}?"
-
-        show_default = not (var.is_optional and var.default is None)
-        if not show_default:
-            return f"{var.name} ({type_label})"
-        return f"{var.name} ({type_label}={self._format_default(var.default)})"
-
-    def _format_default(self, value: object) -> str:
-        if isinstance(value, str):
-            return f'"{value}"'
-        if isinstance(value, Path):
-            return f'"{value}"'
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        return repr(value)
+                    lines.append(f"             vars: {_format_vars(t.vars)}")
+
+        if lines:
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
+
+
+def _format_vars(task_vars: tuple[TaskVar, ...]) -> str:
+    return ", ".join(_format_var(v) for v in task_vars)
+
+
+def _format_var(var: TaskVar) -> str:
+    type_label = var.type.__name__
+    if var.is_optional:
+        type_label = f"{type_label}?"
+
+    show_default = not (var.is_optional and var.default is None)
+    if not show_default:
+        return f"{var.name} ({type_label})"
+    return f"{var.name} ({type_label}={_format_default(var.default)})"
+
+
+def _quote(value: object) -> str:
+    return f'"{value}"'
+
+
+def _format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+# Exact-type dispatch for the supported var types (bool is its own type, so
+# it never falls into int's repr)
+_DEFAULT_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: _quote,
+    PosixPath: _quote,
+    WindowsPath: _quote,
+    bool: _format_bool,
+}
+
+
+def _format_default(value: object) -> str:
+    formatter = _DEFAULT_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, (str, Path)):
+        return _quote(value)
+    return repr(value)
@@ -30,3 +30,37 @@ def test_list_command_prints_task_vars(capsys: pytest.CaptureFixture[str]) -> No
     out = capsys.readouterr().out
     assert 'vars: optimize (bool=false), target (str="x86_64")' in out
     assert "vars: env (str?), port (int=8080)" in out
+
+
+def test_list_command_orders_default_first(capsys: pytest.CaptureFixture[str]) -> None:
+    registry = TaskRegistry()
+    for name in ("beta", "all", "alpha"):
+        registry.register(lambda: None, name=name)
+    registry.default("beta")
+
+    ctx = CommandContext(registry, argparse.Namespace(all_tasks=False))
+    ListCommand(ctx).execute()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == ["Tasks:", "  beta (default)", "  all", "  alpha"]
+
+
+def test_list_command_int_default_for_float_var(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    registry = TaskRegistry()
+
+    def a(x: float = 1.0) -> None:
+        pass
+
+    def b(x: float = 1) -> None:
+        pass
+
+    registry.register(a)
+    registry.register(b)
+
+    ListCommand(CommandContext(registry, argparse.Namespace(all_tasks=False))).execute()
+
+    out = capsys.readouterr().out
+    assert "vars: x (float=1.0)" in out
+    assert "vars: x (float=1)" in out
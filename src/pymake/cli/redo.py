@@ -12,6 +12,8 @@ from .context import CommandContext
 class RedoCommand:
     """Force re-run a target and its dependents."""
 
+    REQUIRES_MAKEFILE = True
+
     def __init__(self, ctx: CommandContext) -> None:
         self.ctx = ctx
 
@@ -31,9 +33,9 @@ class RedoCommand:
     def execute(self) -> None:
         """Force re-run a target and optionally its dependents."""
         found_task = self.ctx.find_target(self.ctx.args.target)
-        self.ctx.check_before_run(found_task)
 
         if self.ctx.args.only:
+            self.ctx.check_before_run(found_task)
             self._redo_only(found_task)
         else:
             self._redo_with_dependents(found_task)
@@ -44,20 +46,15 @@ class RedoCommand:
             self.ctx.registry,
             vars_resolver=self.ctx.vars_resolver,
             parallel=False,
-            force=True,
+            force=False,
             verbose=self.ctx.verbose,
+            fingerprints=self.ctx.fingerprints,
+            resolver=self.ctx.resolver,
         )
 
-        # First, run dependencies (not forced) so inputs are ready
-        deps = self.ctx.resolver.resolve(found_task)
-        for dep in deps:
-            if dep.name != found_task.name:
-                executor.force = False
-                executor._execute_task(dep)
-
-        # Then force-run the target
-        executor.force = True
-        executed = executor._execute_task(found_task)
+        # Dependencies run normally so inputs are ready; only the target
+        # itself is forced
+        executed = executor.run_many([found_task], force_names={found_task.name})
         if not executed and self.ctx.verbose:
             print(f"Warning: {found_task.name} was skipped (run_if condition).")
 
@@ -65,53 +62,28 @@ class RedoCommand:
         """Redo target and all its dependents."""
         resolver = self.ctx.resolver
 
-        # Get all tasks that transitively depend on this one
-        dependent_names = resolver.transitive_dependents(found_task)
-
-        # Build execution order: first the target's dependencies, then target,
-        # then all dependents in topological order
-        tasks_to_run: list[Task] = []
-        seen: set[str] = set()
-
-        # Add the target and its dependencies first
-        target_deps = resolver.resolve(found_task)
-        for t in target_deps:
-            if t.name not in seen:
-                tasks_to_run.append(t)
-                seen.add(t.name)
-
-        # Then add all dependents
-        for dep_name in dependent_names:
-            if dep_name not in seen:
-                dep_task = self.ctx.registry.get(dep_name)
-                if dep_task:
-                    tasks_to_run.append(dep_task)
-                    seen.add(dep_name)
+        # The target and every task that transitively depends on it, in
+        # dependency order. They are the build's targets; the executor merges
+        # their dependency graphs, so each dependent's other inputs are
+        # brought up to date first.
+        dependents = resolver.transitive_dependent_tasks(found_task)
+        dependent_names = {t.name for t in dependents}
+        # Check the merged graph: a cycle may only be reachable through a
+        # dependent, and the executor would raise it as a traceback
+        self.ctx.check_before_run_many(dependents)
 
         executor = Executor(
             self.ctx.registry,
             vars_resolver=self.ctx.vars_resolver,
             parallel=self.ctx.parallel,
             max_workers=self.ctx.args.jobs,
-            force=False,  # We'll selectively force
+            force=False,  # Only the target and its dependents are forced
             verbose=self.ctx.verbose,
+            fingerprints=self.ctx.fingerprints,
+            resolver=self.ctx.resolver,
         )
 
-        any_executed = False
-        for t in tasks_to_run:
-            # Force tasks that are the target or its dependents
-            force_this = t.name in dependent_names
-            if force_this:
-                # Temporarily set force for this task
-                old_force = executor.force
-                executor.force = True
-                if executor._execute_task(t):
-                    any_executed = True
-                executor.force = old_force
-            else:
-                # Run normally (dependencies of target)
-                if executor._execute_task(t):
-                    any_executed = True
+        any_executed = executor.run_many(dependents, force_names=dependent_names)
 
         if not any_executed and self.ctx.verbose:
             print("Nothing to do.")
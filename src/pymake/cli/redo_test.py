@@ -0,0 +1,28 @@
+"""Tests for redo command."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import pytest
+
+from ..task import TaskRegistry
+from .context import CommandContext
+from .redo import RedoCommand
+
+
+def test_redo_reports_cycle_reachable_only_through_dependent(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    a_txt, b_txt, c_txt = (tmp_path / n for n in ("a.txt", "b.txt", "c.txt"))
+    registry = TaskRegistry()
+    registry.register(lambda: None, name="a", outputs=[a_txt])
+    registry.register(lambda: None, name="b", inputs=[a_txt, c_txt], outputs=[b_txt])
+    registry.register(lambda: None, name="c", inputs=[b_txt], outputs=[c_txt])
+
+    args = argparse.Namespace(target="a", only=False, jobs=None)
+    with pytest.raises(SystemExit) as exc:
+        RedoCommand(CommandContext(registry, args)).execute()
+    assert exc.value.code == 1
+    assert "Cyclic dependency detected" in capsys.readouterr().out
@@ -13,6 +13,8 @@ from .context import CommandContext
 class RunCommand:
     """Run specified targets."""
 
+    REQUIRES_MAKEFILE = True
+
     def __init__(self, ctx: CommandContext) -> None:
         self.ctx = ctx
 
@@ -35,8 +37,7 @@ class RunCommand:
             found = self.ctx.find_target(target)
             target_tasks.append(found)
 
-        for t in target_tasks:
-            self.ctx.check_before_run(t)
+        self.ctx.check_before_run_many(target_tasks)
 
         executor = Executor(
             self.ctx.registry,
@@ -45,12 +46,11 @@ class RunCommand:
             max_workers=self.ctx.args.jobs,
             force=self.ctx.args.force,
             verbose=self.ctx.verbose,
+            fingerprints=self.ctx.fingerprints,
+            resolver=self.ctx.resolver,
         )
 
-        any_executed = False
-        for t in target_tasks:
-            if executor.run(t):
-                any_executed = True
+        any_executed = executor.run_many(list(target_tasks))
 
         if not any_executed and self.ctx.verbose:
             print("Nothing to do (all targets up to date).")
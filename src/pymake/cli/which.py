@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import argparse
+from pathlib import Path
 
-from rich.tree import Tree
-
+from ..statcache import StatCache
 from ..task import Task
 from .context import CommandContext
 
+# Same guide characters rich.tree.Tree draws: (space, continue, fork, end)
+_GUIDES = ("    ", "│   ", "├── ", "└── ")
+_ASCII_GUIDES = ("    ", "|   ", "+-- ", "`-- ")
+
 
 class WhichCommand:
     """Show dependency tree for a task or output file."""
 
+    REQUIRES_MAKEFILE = True
+
     def __init__(self, ctx: CommandContext) -> None:
         self.ctx = ctx
 
@@ -35,76 +41,102 @@ class WhichCommand:
         found_task = self.ctx.find_target(self.ctx.args.target)
         show_dependents = self.ctx.args.dependents
         resolver = self.ctx.resolver
-        printed: set[str] = set()
+        # Printed tasks as a bitmask over resolver.task_id bits
+        printed = 0
+        # Shared across nodes so each file is stat'ed once per invocation
+        stat_cache = StatCache()
+        run_status: dict[Task, bool] = {}
+
+        # Every task in the tree gets a staleness label, so stat all their
+        # outputs up front: outputs of different tasks often share a build
+        # directory, and prefetch lists each shared parent once.
+        if show_dependents:
+            tree_names = resolver.transitive_dependents(found_task)
+        else:
+            tree_names = resolver.transitive_deps(found_task)
+        tree_outputs: list[Path] = []
+        for name in tree_names:
+            tree_task = self.ctx.registry.get(name)
+            if tree_task is not None:
+                tree_outputs.extend(tree_task.outputs)
+        stat_cache.prefetch(tree_outputs)
 
         def task_label(t: Task) -> str:
             """Format task name, red with (*) if it would run."""
-            if t.should_run():
+            stale = run_status.get(t)
+            if stale is None:
+                stale = run_status[t] = t.should_run(stat_cache=stat_cache)
+            if stale:
                 return f"[red]{t.name}[/red] (*)"
             return t.name
 
-        def add_subtree(parent: Tree, t: Task) -> None:
-            if t.name in printed:
-                return
-
-            printed.add(t.name)
-
-            # Create node for this task
-            node = parent.add(task_label(t))
-
+        def printable_children(t: Task) -> list[Task]:
             if show_dependents:
                 # Show tasks that depend on this one
                 deps = resolver.dependents(t)
                 # Filter out already-printed deps
-                printable_deps = [d for d in deps if d.name not in printed]
-            else:
-                # Show dependencies (what this task depends on)
-                deps = resolver.dependencies(t)
-                # Filter deps, accounting for what each subtree will cover
-                printable_deps = []
-                covered: set[str] = set()
-                for dep in deps:
-                    if dep.name not in printed and dep.name not in covered:
-                        printable_deps.append(dep)
-                        covered |= resolver.transitive_deps(dep)
-
-            # Show inputs (←) and outputs (→)
-            for inp in t.inputs:
-                node.add(f"[dim]← {inp}[/dim]")
-            for out in t.outputs:
-                node.add(f"[dim]→ {out}[/dim]")
-
-            # Recurse into children
-            for dep in printable_deps:
-                add_subtree(node, dep)
-
-        # Build the tree starting from the target
-        tree = Tree(task_label(found_task))
+                return [d for d in deps if not printed >> resolver.task_id(d) & 1]
 
-        if show_dependents:
-            # Show tasks that depend on target
-            deps = resolver.dependents(found_task)
-            printable_deps = [d for d in deps if d.name not in printed]
-        else:
-            # Show dependencies
-            deps = resolver.dependencies(found_task)
+            # Show dependencies (what this task depends on)
+            deps = resolver.dependencies(t)
+            # Filter deps, accounting for what each subtree will cover
             printable_deps = []
-            covered: set[str] = set()
+            covered = 0
             for dep in deps:
-                if dep.name not in printed and dep.name not in covered:
+                if not (printed | covered) >> resolver.task_id(dep) & 1:
                     printable_deps.append(dep)
-                    covered |= resolver.transitive_deps(dep)
-
-        # Add inputs/outputs to root
-        for inp in found_task.inputs:
-            tree.add(f"[dim]← {inp}[/dim]")
-        for out in found_task.outputs:
-            tree.add(f"[dim]→ {out}[/dim]")
-
-        printed.add(found_task.name)
-
-        # Add subtrees for dependencies/dependents
-        for dep in printable_deps:
-            add_subtree(tree, dep)
+                    covered |= resolver.transitive_deps_mask(dep)
+            return printable_deps
+
+        # A printed branch can't be revised, so first walk the tree to fix
+        # every node's children. An explicit stack instead of recursion;
+        # children are pushed in reverse so each subtree is finished before
+        # its next sibling, like a recursive preorder walk. A task reached
+        # again later is dropped, so it stays where the walk first met it.
+        tree_children: dict[Task, list[Task]] = {}
+        walk: list[tuple[Task | None, Task]] = [(None, found_task)]
+        while walk:
+            parent, t = walk.pop()
+            bit = 1 << resolver.task_id(t)
+            if printed & bit:
+                continue
+            printed |= bit
+            if parent is not None:
+                tree_children[parent].append(t)
+            tree_children[t] = []
+            walk.extend((t, dep) for dep in reversed(printable_children(t)))
+
+        console = self.ctx.console
+        space, cont, fork, end = (
+            _ASCII_GUIDES if console.options.ascii_only else _GUIDES
+        )
 
-        self.ctx.console.print(tree)
+        def emit(line: str) -> None:
+            # Tree labels aren't repr-highlighted, so neither are these
+            console.print(line, highlight=False)
+
+        # Print the tree line by line instead of building a rich Tree, so no
+        # node outlives its line. Entries are (guide prefix for the node's
+        # own line, prefix for its children, task).
+        stack: list[tuple[str, str, Task]] = [("", "", found_task)]
+        while stack:
+            line_prefix, child_prefix, t = stack.pop()
+            emit(line_prefix + task_label(t))
+            children = tree_children[t]
+
+            # Show inputs (←) and outputs (→), then the child subtrees
+            io_lines = [f"[dim]← {inp}[/dim]" for inp in t.inputs]
+            io_lines.extend(f"[dim]→ {out}[/dim]" for out in t.outputs)
+            for i, io_line in enumerate(io_lines):
+                last = i == len(io_lines) - 1 and not children
+                emit(child_prefix + (end if last else fork) + io_line)
+
+            for i in reversed(range(len(children))):
+                last = i == len(children) - 1
+                stack.append(
+                    (
+                        child_prefix + (end if last else fork),
+                        child_prefix + (space if last else cont),
+                        children[i],
+                    )
+                )
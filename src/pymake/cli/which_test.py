@@ -0,0 +1,74 @@
+"""Tests for which command."""
+
+from __future__ import annotations
+
+import argparse
+import io
+
+from rich.console import Console
+
+from ..task import TaskRegistry
+from .context import CommandContext
+from .which import WhichCommand
+
+
+def _which(registry: TaskRegistry, target: str, *, dependents: bool) -> list[str]:
+    ctx = CommandContext(
+        registry, argparse.Namespace(target=target, dependents=dependents)
+    )
+    out = io.StringIO()
+    ctx._console = Console(file=out, width=120, color_system=None)
+    WhichCommand(ctx).execute()
+    return out.getvalue().splitlines()
+
+
+def test_dependents_tree_places_task_where_walk_first_reaches_it() -> None:
+    # b and a both depend on c; a also depends on b
+    registry = TaskRegistry()
+
+    def c() -> None:
+        pass
+
+    def b() -> None:
+        pass
+
+    def a() -> None:
+        pass
+
+    registry.register(c)
+    registry.register(b, inputs=[c])
+    registry.register(a, inputs=[b, c])
+
+    assert _which(registry, "c", dependents=True) == [
+        "c (*)",
+        "└── b (*)",
+        "    └── a (*)",
+    ]
+
+
+def test_dependencies_tree_for_diamond() -> None:
+    registry = TaskRegistry()
+
+    def d() -> None:
+        pass
+
+    def b() -> None:
+        pass
+
+    def c() -> None:
+        pass
+
+    def a() -> None:
+        pass
+
+    registry.register(d)
+    registry.register(b, inputs=[d])
+    registry.register(c, inputs=[d])
+    registry.register(a, inputs=[b, c])
+
+    assert _which(registry, "a", dependents=False) == [
+        "a (*)",
+        "├── b (*)",
+        "│   └── d (*)",
+        "└── c (*)",
+    ]
@@ -232,24 +232,15 @@ class TaskContext:
         force_set: set[str] = set(resolver.transitive_dependents(anchor))
         force_set.add(anchor.name)
 
-        execution_order = resolver.resolve(target)
-
+        # The executor forces per task, so force_from can run in parallel
         executor = Executor(
             self.registry,
-            parallel=False,  # per-task force toggling needs sequential control
+            parallel=parallel or jobs is not None,
+            max_workers=jobs,
             force=False,
+            resolver=resolver,
         )
-        _ = parallel, jobs  # accepted for API parity; sequential by design here
-
-        # Validate before running, mirroring Executor.run()
-        executor._validate_inputs_producible(execution_order)
-
-        any_executed = False
-        for t in execution_order:
-            executor.force = t.name in force_set
-            if executor._execute_task(t):
-                any_executed = True
-        return any_executed
+        return executor.run_many([target], force_names=force_set)
 
     def _print_plan(
         self,
@@ -173,6 +173,11 @@ class TestRun:
         # force_from anchor: anchor + downstream re-run, upstream stays.
         ctx.run(downstream, force_from="anchor")
         assert runs == ["anchor", "downstream"]
+        runs.clear()
+
+        # Same selection through the parallel scheduler.
+        ctx.run(downstream, force_from="anchor", jobs=2)
+        assert runs == ["anchor", "downstream"]
 
     def test_force_and_force_from_mutually_exclusive(self, tmp_path: Path) -> None:
         ctx = context(cwd=tmp_path)
@@ -205,6 +210,24 @@ class TestRun:
         with pytest.raises(ValueError, match="no default registered"):
             ctx.run()
 
+    def test_run_rejects_outputs_aliased_through_symlink(self, tmp_path: Path) -> None:
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        ctx = context(cwd=tmp_path)
+        runs: list[str] = []
+
+        @ctx.task(outputs=["real/out.txt"])
+        def a() -> None:
+            runs.append("a")
+
+        @ctx.task(outputs=["link/out.txt"])
+        def b() -> None:
+            runs.append("b")
+
+        with pytest.raises(ValueError, match="already produced by task 'a'"):
+            ctx.run(b)
+        assert runs == []
+
 
 class TestNoCrossLeak:
     def test_two_contexts_independent(self, tmp_path: Path) -> None:
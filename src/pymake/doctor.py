@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 
 from .resolver import CyclicDependencyError, DependencyResolver
+from .statcache import StatCache
 from .task import Task, TaskRegistry
 
 
@@ -23,9 +27,11 @@ class Issue:
 class Doctor:
     """Static analyzer for task dependency graphs."""
 
-    def __init__(self, registry: TaskRegistry) -> None:
+    def __init__(
+        self, registry: TaskRegistry, resolver: DependencyResolver | None = None
+    ) -> None:
         self.registry = registry
-        self.resolver = DependencyResolver(registry)
+        self.resolver = resolver or DependencyResolver(registry)
 
     def check_all(self, target: Task | None = None) -> list[Issue]:
         """Run all checks and collect issues.
@@ -33,62 +39,90 @@ class Doctor:
         If target is provided, only check tasks reachable from that target.
         Otherwise, check all tasks.
         """
+        if target:
+            return self.check_targets([target])
+
         issues: list[Issue] = []
+        tasks = list(self.registry.all_tasks())
+        # The cycle scan is CPU-bound and the input check is mostly stat
+        # calls (which release the GIL), so overlap them. Issues keep the
+        # sequential order: cycles first.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            inputs_future = pool.submit(self._check_unproducible_inputs, tasks)
+            issues.extend(self._check_cycles())
+            issues.extend(inputs_future.result())
 
-        if target:
+        return issues
+
+    def check_targets(self, targets: list[Task]) -> list[Issue]:
+        """Check the tasks reachable from any of *targets*, in one pass.
+
+        Shared dependencies are checked once. A target whose graph has a
+        cycle is reported and its tasks are left out.
+        """
+        issues: list[Issue] = []
+        acyclic: list[Task] = []
+
+        for target in targets:
             try:
-                tasks = self.resolver.resolve(target)
+                # Memoized, so the run that follows doesn't resolve again
+                self.resolver.resolve(target)
             except CyclicDependencyError as e:
                 issues.append(Issue("error", target.name, str(e)))
-                return issues
-        else:
-            tasks = list(self.registry.all_tasks())
-            # Check for cycles in all tasks
-            issues.extend(self._check_cycles(tasks))
+                continue
+            acyclic.append(target)
 
+        if len(acyclic) == 1:
+            # Common single-target case: stream the memoized order as is
+            tasks: Iterable[Task] = self.resolver.iter_reachable(acyclic[0])
+        else:
+            tasks = dict.fromkeys(
+                task
+                for target in acyclic
+                for task in self.resolver.iter_reachable(target)
+            )
         issues.extend(self._check_unproducible_inputs(tasks))
 
         return issues
 
-    def _check_cycles(self, tasks: list[Task]) -> list[Issue]:
-        """Check for cyclic dependencies."""
+    def _check_cycles(self) -> list[Issue]:
+        """Check for cyclic dependencies, one issue per cycle."""
         issues: list[Issue] = []
-        checked: set[str] = set()
-
-        for task in tasks:
-            if task.name in checked:
-                continue
-            try:
-                resolved = self.resolver.resolve(task)
-                checked.update(t.name for t in resolved)
-            except CyclicDependencyError as e:
-                issues.append(Issue("error", task.name, str(e)))
-                checked.add(task.name)
-
+        for cycle in self.resolver.find_all_cycles():
+            issues.append(Issue("error", cycle[0], str(CyclicDependencyError(cycle))))
         return issues
 
-    def _check_unproducible_inputs(self, tasks: list[Task]) -> list[Issue]:
-        """Check for inputs that don't exist and no task produces."""
+    def _check_unproducible_inputs(self, tasks: Iterable[Task]) -> list[Issue]:
+        """Check for inputs that don't exist and no task produces.
+
+        *tasks* is consumed once; only tasks with inputs are kept around.
+        """
         issues: list[Issue] = []
-        seen: set[tuple[str, str]] = set()
-
-        for task in tasks:
-            for input_path in task.inputs:
-                key = (task.name, str(input_path))
-                if key in seen:
-                    continue
-                seen.add(key)
-
-                if not input_path.exists():
-                    producing_task = self.registry.by_output(input_path)
-                    if not producing_task:
-                        issues.append(
-                            Issue(
-                                "error",
-                                task.name,
-                                f"input '{input_path}' does not exist and no task produces it",
-                            )
+        # Answer per path, not per (task, path): inputs shared by many tasks
+        # are looked up once
+        unproducible: dict[Path, bool] = {}
+
+        with_inputs = [task for task in tasks if task.inputs]
+        # Inputs sharing a directory are stat'ed with one scandir of it
+        stat_cache = StatCache()
+        stat_cache.prefetch({p for task in with_inputs for p in task.inputs})
+
+        for task in with_inputs:
+            for input_path in dict.fromkeys(task.inputs):
+                missing = unproducible.get(input_path)
+                if missing is None:
+                    missing = unproducible[input_path] = (
+                        not stat_cache.exists(input_path)
+                        and self.registry.by_output(input_path) is None
+                    )
+                if missing:
+                    issues.append(
+                        Issue(
+                            "error",
+                            task.name,
+                            f"input '{input_path}' does not exist "
+                            "and no task produces it",
                         )
+                    )
 
         return issues
-
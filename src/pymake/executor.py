@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import concurrent.futures
+import os
 import sys
 import threading
+from collections.abc import Collection, Sequence
 from typing import TextIO
 
+from .fingerprint import FingerprintDB
 from .resolver import CyclicDependencyError, DependencyResolver
+from .statcache import StatCache
 from .task import Task, TaskRegistry
 from .vars import VarsResolver
 
@@ -68,15 +72,19 @@ class Executor:
         force: bool = False,
         verbose: bool = True,
         output: TextIO | None = None,
+        fingerprints: FingerprintDB | None = None,
+        resolver: DependencyResolver | None = None,
     ) -> None:
         self.registry = registry
-        self.resolver = DependencyResolver(registry)
+        self.resolver = resolver or DependencyResolver(registry)
         self.parallel = parallel
         self.max_workers = max_workers
         self.force = force
         self.verbose = verbose
         self.output = output or sys.stdout
         self.vars_resolver = vars_resolver or VarsResolver()
+        self.stat_cache = StatCache()
+        self.fingerprints = fingerprints
         self._vars_validated = False
         self._lock = threading.Lock()
 
@@ -92,123 +100,131 @@ class Executor:
 
         Returns True if any task was executed.
         """
-        if isinstance(target, str):
-            task = self.registry.find_target(target)
-            if not task:
-                raise ValueError(f"Unknown target: {target}")
-        else:
-            task = target
+        return self.run_many([target])
+
+    def run_many(
+        self,
+        targets: Sequence[str | Task],
+        *,
+        force_names: Collection[str] = (),
+    ) -> bool:
+        """
+        Run several targets as one build.
+
+        The targets' dependency graphs are merged, so a task shared by
+        several targets (phony ones included) runs at most once, and in
+        parallel mode work from different targets can interleave.
+
+        Tasks named in *force_names* run as if ``force`` were set; the rest
+        follow ``self.force``. This is how ``redo`` forces a target and its
+        dependents while still scheduling them in parallel.
+
+        Returns True if any task was executed.
+        """
+        tasks: list[Task] = []
+        for target in targets:
+            if isinstance(target, str):
+                task = self.registry.find_target(target)
+                if not task:
+                    raise ValueError(f"Unknown target: {target}")
+                tasks.append(task)
+            else:
+                tasks.append(target)
 
         self._validate_vars_once()
 
+        # Stats are only trusted within a single run; files may have changed
+        # on disk since a previous run() on this executor.
+        self.stat_cache.clear()
+
         # Resolve dependencies
         try:
-            execution_order = self.resolver.resolve(task)
+            execution_order = self.resolver.resolve_many(tasks)
         except CyclicDependencyError:
             raise
 
         # Validate all inputs are either existing or producible
         self._validate_inputs_producible(execution_order)
+        # Warm the cache for the leading run of up-to-date tasks; it is
+        # cleared again as soon as any task body runs.
+        self.stat_cache.stat_many(
+            out for task in execution_order for out in task.outputs
+        )
 
-        if self.parallel:
-            return self._run_parallel(execution_order)
-        else:
-            return self._run_sequential(execution_order)
+        forced = frozenset(force_names)
+        try:
+            if self.parallel:
+                return self._run_parallel(execution_order, forced)
+            else:
+                return self._run_sequential(execution_order, forced)
+        finally:
+            if self.fingerprints is not None:
+                self.fingerprints.save()
 
     def _validate_inputs_producible(self, tasks: list[Task]) -> None:
         """Validate that all input files either exist or have a producing task."""
+        # Deliberately not via stat_cache: inputs still missing here are
+        # usually produced later in the run.
         for task in tasks:
             for input_path in task.inputs:
-                if not input_path.exists():
+                if not os.path.exists(input_path):
                     # Check if any task produces this file
                     producing_task = self.registry.by_output(input_path)
                     if not producing_task:
                         raise UnproducibleInputError(task.name, str(input_path))
 
-    def _run_sequential(self, tasks: list[Task]) -> bool:
+    def _run_sequential(
+        self, tasks: list[Task], forced: frozenset[str] = frozenset()
+    ) -> bool:
         """Run tasks sequentially in dependency order."""
         any_executed = False
 
         for task in tasks:
-            executed = self._execute_task(task)
+            executed = self._execute_task(task, self.force or task.name in forced)
             if executed:
                 any_executed = True
 
         return any_executed
 
-    def _run_parallel(self, tasks: list[Task]) -> bool:
-        """Run tasks in parallel where possible."""
-        # Build a map of task -> set of dependency task names
-        task_deps: dict[str, set[str]] = {}
+    def _run_parallel(
+        self, tasks: list[Task], forced: frozenset[str] = frozenset()
+    ) -> bool:
+        """Run tasks in parallel where possible.
+
+        Each task counts its outstanding dependencies; when a task finishes,
+        every successor whose count drops to zero is submitted immediately,
+        so a slow task only holds back the tasks that actually need it.
+        """
+        task_map = {t.name: t for t in tasks}
+        remaining_deps: dict[str, int] = {}
+        successors: dict[str, list[str]] = {name: [] for name in task_map}
         for task in tasks:
-            deps = self.resolver.dependencies(task)
-            task_deps[task.name] = {d.name for d in deps}
+            dep_names = {
+                d.name for d in self.resolver.dependencies(task) if d.name in task_map
+            }
+            remaining_deps[task.name] = len(dep_names)
+            for dep_name in dep_names:
+                successors[dep_name].append(task.name)
 
-        # Track completed tasks
-        completed: set[str] = set()
-        completed_lock = threading.Lock()
         any_executed = False
-        executed_lock = threading.Lock()
-
-        # Track failed tasks
-        failed: set[str] = set()
         first_error: ExecutionError | None = None
-        error_lock = threading.Lock()
-
-        task_map = {t.name: t for t in tasks}
-
-        def can_run(task_name: str) -> bool:
-            """Check if all dependencies are completed."""
-            with completed_lock:
-                return task_deps[task_name].issubset(completed)
-
-        def mark_completed(task_name: str) -> None:
-            with completed_lock:
-                completed.add(task_name)
-
-        def execute_wrapper(task: Task) -> bool:
-            """Wrapper to execute a task and handle errors."""
-            nonlocal any_executed, first_error
-
-            # Check if any dependency failed
-            with error_lock:
-                if failed:
-                    return False
-
-            try:
-                executed = self._execute_task(task)
-                if executed:
-                    with executed_lock:
-                        any_executed = True
-                mark_completed(task.name)
-                return True
-            except Exception as e:
-                with error_lock:
-                    failed.add(task.name)
-                    if first_error is None:
-                        if isinstance(e, ExecutionError):
-                            first_error = e
-                        else:
-                            first_error = ExecutionError(task.name, e)
-                return False
 
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=self.max_workers
         ) as executor:
-            pending = set(task_map.keys())
             futures: dict[concurrent.futures.Future[bool], str] = {}
 
-            while pending or futures:
-                # Submit ready tasks
-                ready = [name for name in pending if can_run(name)]
-                for name in ready:
-                    pending.remove(name)
-                    future = executor.submit(execute_wrapper, task_map[name])
-                    futures[future] = name
+            def submit(name: str) -> None:
+                future = executor.submit(
+                    self._execute_task, task_map[name], self.force or name in forced
+                )
+                futures[future] = name
 
-                if not futures:
-                    break
+            for task in tasks:
+                if remaining_deps[task.name] == 0:
+                    submit(task.name)
 
+            while futures:
                 # Wait for at least one task to complete
                 done, _ = concurrent.futures.wait(
                     futures.keys(),
@@ -216,33 +232,60 @@ class Executor:
                 )
 
                 for future in done:
-                    del futures[future]
+                    name = futures.pop(future)
+                    try:
+                        if future.result():
+                            any_executed = True
+                    except Exception as e:
+                        if first_error is None:
+                            if isinstance(e, ExecutionError):
+                                first_error = e
+                            else:
+                                first_error = ExecutionError(name, e)
+                        continue
 
-                # Check for errors
-                with error_lock:
-                    if first_error:
-                        # Cancel pending futures
-                        for f in futures:
-                            f.cancel()
-                        raise first_error
+                    if first_error is None:
+                        for succ in successors[name]:
+                            remaining_deps[succ] -= 1
+                            if remaining_deps[succ] == 0:
+                                submit(succ)
+
+                if first_error:
+                    # Cancel pending futures
+                    for f in futures:
+                        f.cancel()
+                    raise first_error
 
         return any_executed
 
-    def _execute_task(self, task: Task) -> bool:
+    def _execute_task(self, task: Task, force: bool | None = None) -> bool:
         """
         Execute a single task if needed.
 
+        *force* overrides ``self.force`` for this task only.
+
         Returns True if the task was executed.
         """
         self._validate_vars_once()
+        if force is None:
+            force = self.force
 
         # Check if task should run based on file timestamps
-        if not task.should_run(self.force):
+        if not task.should_run(force, self.stat_cache):
             self.log(f"[skip] {task.name} (up to date)")
             return False
 
+        # Newer-by-mtime but byte-identical inputs don't need a rebuild
+        if (
+            not force
+            and self.fingerprints is not None
+            and self.fingerprints.unchanged(task, self.stat_cache)
+        ):
+            self.log(f"[skip] {task.name} (inputs unchanged)")
+            return False
+
         # --force bypasses run_if / run_if_not entirely: force means force.
-        if not self.force:
+        if not force:
             if task.run_if is not None:
                 try:
                     if not task.run_if():
@@ -259,28 +302,35 @@ class Executor:
                 except Exception as e:
                     raise ExecutionError(task.name, e) from e
 
-        # Validate all input files exist before running
+        # Validate all input files exist before running (should_run has
+        # already stat'ed them, so these are cache hits)
         for input_path in task.inputs:
-            if not input_path.exists():
+            if not self.stat_cache.exists(input_path):
                 raise MissingInputError(task.name, str(input_path))
 
         # Execute the task
         self.log(f"[run] {task.name}")
+        self._ensure_output_dirs(task)
         try:
             kwargs = self.vars_resolver.resolve(task)
             task.func(**kwargs)
         except Exception as e:
             raise ExecutionError(task.name, e) from e
+        finally:
+            # The body may have rewritten any file, not just its declared
+            # outputs (e.g. a phony formatter), so no cached stat is safe
+            self.stat_cache.clear()
 
         # Validate all output files were created (excluding touch file)
         for output_path in task.outputs:
             if task.touch and output_path == task.touch:
                 continue  # Touch file is created by executor, not the task
-            if not output_path.exists():
+            if not self.stat_cache.exists(output_path):
                 raise MissingOutputError(task.name, str(output_path))
 
         # Touch file if specified
         if task.touch:
+            # The body may have removed the directory made for it above
             task.touch.parent.mkdir(parents=True, exist_ok=True)
             task.touch.touch()
 
@@ -301,15 +351,23 @@ class Executor:
             except Exception as e:
                 raise ExecutionError(task.name, e) from e
 
+        if self.fingerprints is not None:
+            self.fingerprints.record(task, self.stat_cache)
+
         return True
 
+    def _ensure_output_dirs(self, task: Task) -> None:
+        """Create the parent directories of a task's outputs.
+
+        Not memoized across tasks: any task body may remove a directory an
+        earlier task needed (e.g. a ``clean`` step running ``rmtree``).
+        """
+        for parent in {out.parent for out in task.outputs}:
+            parent.mkdir(parents=True, exist_ok=True)
+
     def run_multiple(self, targets: list[str]) -> bool:
         """Run multiple targets."""
-        any_executed = False
-        for target in targets:
-            if self.run(target):
-                any_executed = True
-        return any_executed
+        return self.run_many(list(targets))
 
     def _validate_vars_once(self) -> None:
         if self._vars_validated:
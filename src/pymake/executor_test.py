@@ -2,6 +2,7 @@
 
 import io
 import os
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -203,6 +204,34 @@ class TestExecutor:
             assert executed.index("a") < executed.index("c")
             assert executed.index("b") < executed.index("c")
 
+    def test_parallel_releases_successors_without_waiting_for_layer(self) -> None:
+        import threading
+
+        registry = TaskRegistry()
+        fast_chain_done = threading.Event()
+        seen: list[bool] = []
+
+        def slow() -> None:
+            # Only finishes promptly if fast2 ran while slow was still busy
+            seen.append(fast_chain_done.wait(timeout=5))
+
+        def fast1() -> None:
+            pass
+
+        def fast2() -> None:
+            fast_chain_done.set()
+
+        def all_tasks() -> None:
+            pass
+
+        registry.register(slow)
+        registry.register(fast1)
+        registry.register(fast2, inputs=[fast1])
+        registry.register(all_tasks, name="all", inputs=[slow, fast2])
+
+        Executor(registry, parallel=True, max_workers=2, verbose=False).run("all")
+        assert seen == [True]
+
     def test_touch_creates_file(self) -> None:
         registry = TaskRegistry()
         executed = []
@@ -229,6 +258,88 @@ class TestExecutor:
             executor.run("a")
             assert executed == []
 
+    def test_run_many_runs_shared_dependency_once(self) -> None:
+        registry = TaskRegistry()
+        executed: list[str] = []
+
+        def setup() -> None:
+            executed.append("setup")
+
+        def lint() -> None:
+            executed.append("lint")
+
+        def test() -> None:
+            executed.append("test")
+
+        registry.register(setup)
+        registry.register(lint, inputs=[setup])
+        registry.register(test, inputs=[setup])
+
+        assert Executor(registry, verbose=False).run_many(["lint", "test"])
+        assert executed == ["setup", "lint", "test"]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_run_many_forces_only_named_tasks(
+        self, tmp_path: Path, parallel: bool
+    ) -> None:
+        registry = TaskRegistry()
+        executed: list[str] = []
+        src = tmp_path / "src.txt"
+        mid = tmp_path / "mid.txt"
+        src.write_text("x")
+        mid.write_text("x")
+
+        def gen() -> None:
+            executed.append("gen")
+            src.write_text("x")
+
+        def build() -> None:
+            executed.append("build")
+            mid.write_text("x")
+
+        registry.register(gen, outputs=[src])
+        registry.register(build, inputs=[src], outputs=[mid])
+
+        executor = Executor(registry, verbose=False, parallel=parallel)
+        assert executor.run_many(["build"], force_names={"build"})
+        assert executed == ["build"]
+        assert executor.force is False
+
+    def test_creates_output_parent_dirs(self, tmp_path: Path) -> None:
+        registry = TaskRegistry()
+        out = tmp_path / "build" / "nested" / "out.txt"
+
+        def build() -> None:
+            out.write_text("x")
+
+        registry.register(build, outputs=[out])
+        Executor(registry, verbose=False).run("build")
+        assert out.read_text() == "x"
+
+    def test_touch_dir_removed_by_earlier_task_is_recreated(
+        self, tmp_path: Path
+    ) -> None:
+
+        build = tmp_path / "build"
+        registry = TaskRegistry()
+
+        def a() -> None:
+            (build / "a.txt").write_text("x")
+
+        def wipe() -> None:
+            shutil.rmtree(build)
+
+        def c() -> None:
+            pass
+
+        registry.register(a, outputs=[build / "a.txt"])
+        registry.register(wipe)
+        registry.register(c, touch=build / ".c")
+        registry.register(lambda: None, name="all", inputs=[a, wipe, c])
+
+        Executor(registry, verbose=False).run("all")
+        assert (build / ".c").exists()
+
     def test_touch_with_inputs(self) -> None:
         registry = TaskRegistry()
         executed = []
@@ -528,6 +639,127 @@ class TestForceBypassesRunIf:
         assert executed == ["a"]
 
 
+class TestStatCacheInvalidation:
+    def test_downstream_sees_rewritten_outputs(self, tmp_path: Path) -> None:
+        """A cached stat of an upstream output must not hide its rewrite."""
+        src = tmp_path / "src.txt"
+        mid = tmp_path / "mid.txt"
+        out = tmp_path / "out.txt"
+        for i, p in enumerate((src, mid, out)):
+            p.write_text("x")
+            os.utime(p, (1000 + i, 1000 + i))
+
+        registry = TaskRegistry()
+        executed: list[str] = []
+
+        def make_mid() -> None:
+            executed.append("mid")
+            mid.write_text("y")
+
+        registry.register(make_mid, name="mid", inputs=[src], outputs=[mid])
+        registry.register(
+            lambda: executed.append("out"), name="out", inputs=[mid], outputs=[out]
+        )
+
+        executor = Executor(registry, verbose=False)
+        executor.run("out")
+        assert executed == []
+
+        os.utime(src, (2000, 2000))
+        executor.run("out")
+        assert executed == ["mid", "out"]
+
+    def test_produced_input_spelled_differently_is_not_prestatted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An input the run produces is stat'ed after its producer runs."""
+        monkeypatch.chdir(tmp_path)
+        out = tmp_path / "out.txt"
+        out.write_text("x")
+        registry = TaskRegistry()
+        executed: list[str] = []
+
+        def gen() -> None:
+            executed.append("gen")
+            Path("gen.txt").write_text("y")
+
+        registry.register(gen, name="gen", outputs=["gen.txt"])
+        registry.register(
+            lambda: executed.append("out"),
+            name="out",
+            inputs=[tmp_path / "gen.txt"],
+            outputs=[out],
+        )
+
+        Executor(registry, verbose=False).run("out")
+        assert executed == ["gen", "out"]
+
+    def test_source_rewritten_by_phony_task_is_seen(self, tmp_path: Path) -> None:
+        """Unproduced inputs aren't stat'ed before earlier tasks have run."""
+        src = tmp_path / "a.py"
+        check = tmp_path / "build" / ".lint-check"
+        check.parent.mkdir()
+        src.write_text("x")
+        check.write_text("")
+        os.utime(src, (1000, 1000))
+        os.utime(check, (2000, 2000))
+
+        registry = TaskRegistry()
+        executed: list[str] = []
+
+        def format() -> None:
+            executed.append("format")
+            with src.open("a") as f:
+                f.write("y")
+
+        def lint() -> None:
+            executed.append("lint")
+            check.touch()
+
+        registry.register(format)
+        registry.register(lint, inputs=[src], outputs=[check])
+        registry.register(lambda: None, name="all", inputs=[format, lint])
+
+        Executor(registry, verbose=False).run("all")
+        assert executed == ["format", "lint"]
+
+    def test_source_stat_cached_before_phony_rewrite_is_dropped(
+        self, tmp_path: Path
+    ) -> None:
+        """A stat taken by an earlier consumer doesn't outlive a rewrite."""
+        src = tmp_path / "src.txt"
+        out1 = tmp_path / "out1"
+        out2 = tmp_path / "out2"
+        for path in (src, out1, out2):
+            path.write_text("x")
+        os.utime(src, (1000, 1000))
+        os.utime(out1, (2000, 2000))
+        os.utime(out2, (2000, 2000))
+
+        registry = TaskRegistry()
+        executed: list[str] = []
+
+        def t1() -> None:
+            executed.append("t1")
+
+        def fmt() -> None:
+            executed.append("fmt")
+            with src.open("a") as f:
+                f.write("y")
+
+        def t2() -> None:
+            executed.append("t2")
+            out2.touch()
+
+        registry.register(t1, inputs=[src], outputs=[out1])
+        registry.register(fmt)
+        registry.register(t2, inputs=[src], outputs=[out2])
+        registry.register(lambda: None, name="all", inputs=[t1, fmt, t2])
+
+        Executor(registry, verbose=False).run("all")
+        assert executed == ["fmt", "t2"]
+
+
 class TestRunIfEndToEndWithTreeDigest:
     """Drive the full digest-based skip loop through the executor."""
 
@@ -0,0 +1,174 @@
+"""Content fingerprints for task inputs.
+
+mtime comparison rebuilds whenever an input is touched — a ``git checkout``
+or a CI cache restore bumps every mtime without changing a byte. A
+:class:`FingerprintDB` remembers, per task, the ``(size, mtime_ns, digest)``
+of each input as of the task's last successful run. When mtime says a task
+is stale, the executor asks the database whether the inputs' *contents*
+actually changed; if not, the task is skipped.
+
+An input whose size+mtime still match the stored entry is accepted without
+reading it (the same rsync trick :mod:`pymake.digest` uses); only mismatches
+are hashed with blake2b. The database is a JSON file, conventionally under
+``.pymake/``, written atomically via rename.
+
+A record is only trustworthy if every run of the task since was recorded.
+Runs without content hashing use ``FingerprintDB(check=False)``, which just
+drops the records of the tasks it runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .statcache import StatCache
+
+if TYPE_CHECKING:
+    from .task import Task
+
+__all__ = ["FingerprintDB", "DEFAULT_FINGERPRINT_PATH"]
+
+DEFAULT_FINGERPRINT_PATH = Path(".pymake") / "fingerprints.json"
+
+# Files larger than this are hashed through mmap instead of read().
+_MMAP_THRESHOLD = 64 * 1024
+
+# [size, mtime_ns, digest] — a list so it round-trips through JSON.
+_Entry = list[int | str]
+
+
+def _hash_file(path: Path, size: int) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+class FingerprintDB:
+    """Persistent per-task input fingerprints.
+
+    With ``check=False`` the database never skips a task: :meth:`unchanged`
+    is always ``False`` and :meth:`record` forgets the task instead of
+    hashing its inputs.
+
+    Safe to share between the executor's worker threads.
+    """
+
+    def __init__(
+        self, path: str | Path = DEFAULT_FINGERPRINT_PATH, *, check: bool = True
+    ) -> None:
+        self.path = Path(path)
+        self.check = check
+        self._data: dict[str, dict[str, _Entry]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _entries(self) -> dict[str, dict[str, _Entry]]:
+        if self._data is None:
+            try:
+                loaded = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                loaded = {}
+            self._data = loaded if isinstance(loaded, dict) else {}
+        return self._data
+
+    def unchanged(self, task: Task, stat_cache: StatCache | None = None) -> bool:
+        """Return ``True`` if *task*'s inputs match its last recorded run.
+
+        Always ``False`` for phony tasks, tasks without inputs, tasks with a
+        missing output, and tasks that have never been recorded.
+        """
+        if not self.check or task.is_phony or not task.inputs:
+            return False
+
+        cache = stat_cache if stat_cache is not None else StatCache()
+        if not all(cache.exists(out) for out in task.outputs):
+            return False
+
+        with self._lock:
+            stored = self._entries().get(task.name)
+            if stored is None or set(stored) != {str(p) for p in task.inputs}:
+                return False
+
+            for inp in task.inputs:
+                st = cache.stat(inp)
+                if st is None or not stat.S_ISREG(st.st_mode):
+                    return False
+                size, mtime_ns, digest = stored[str(inp)]
+                if st.st_size != size:
+                    return False
+                if st.st_mtime_ns == mtime_ns:
+                    continue
+                if _hash_file(inp, st.st_size) != digest:
+                    return False
+                # Same bytes, new mtime: remember it so the next check is
+                # a size+mtime hit instead of another hash.
+                stored[str(inp)] = [size, st.st_mtime_ns, digest]
+                self._dirty = True
+
+        return True
+
+    def record(self, task: Task, stat_cache: StatCache | None = None) -> None:
+        """Store fingerprints of *task*'s inputs after a successful run."""
+        if task.is_phony or not task.inputs:
+            return
+
+        if not self.check:
+            # The inputs this run saw aren't recorded, so an older record
+            # could later vouch for outputs built from different bytes
+            with self._lock:
+                if self._entries().pop(task.name, None) is not None:
+                    self._dirty = True
+            return
+
+        cache = stat_cache if stat_cache is not None else StatCache()
+        with self._lock:
+            entries = self._entries()
+            previous = entries.get(task.name, {})
+            current: dict[str, _Entry] = {}
+            for inp in task.inputs:
+                st = cache.stat(inp)
+                if st is None or not stat.S_ISREG(st.st_mode):
+                    # Directories and special files can't be fingerprinted;
+                    # fall back to plain mtime semantics for this task.
+                    entries.pop(task.name, None)
+                    self._dirty = True
+                    return
+                old = previous.get(str(inp))
+                if old is not None and old[:2] == [st.st_size, st.st_mtime_ns]:
+                    digest = old[2]
+                else:
+                    digest = _hash_file(inp, st.st_size)
+                current[str(inp)] = [st.st_size, st.st_mtime_ns, digest]
+            entries[task.name] = current
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the database if anything changed (atomic rename)."""
+        with self._lock:
+            if not self._dirty or self._data is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self._data, f, sort_keys=True)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self._dirty = False
@@ -0,0 +1,125 @@
+"""Tests for fingerprint.py."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from pymake import Executor, FingerprintDB, TaskRegistry
+
+
+def _bump_mtime(path: Path, seconds: int = 10) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def _run(registry: TaskRegistry, db_path: Path) -> None:
+    """Run ``build`` the way a fresh CLI invocation would."""
+    Executor(registry, verbose=False, fingerprints=FingerprintDB(db_path)).run("build")
+
+
+class TestFingerprintDB:
+    def _setup(self, tmp_path: Path) -> tuple[TaskRegistry, Path, Path, list[str]]:
+        src = tmp_path / "src.txt"
+        out = tmp_path / "out.txt"
+        src.write_text("hello")
+        runs: list[str] = []
+
+        def build() -> None:
+            runs.append("build")
+            out.write_text(src.read_text().upper())
+
+        registry = TaskRegistry()
+        registry.register(build, inputs=[src], outputs=[out])
+        return registry, src, out, runs
+
+    def test_touched_but_identical_input_skips(self, tmp_path: Path) -> None:
+        registry, src, _, runs = self._setup(tmp_path)
+        db_path = tmp_path / ".pymake" / "fingerprints.json"
+
+        _run(registry, db_path)
+        assert runs == ["build"]
+        assert db_path.exists()
+
+        _bump_mtime(src)
+        _run(registry, db_path)
+        assert runs == ["build"]
+
+    def test_changed_input_runs(self, tmp_path: Path) -> None:
+        registry, src, _, runs = self._setup(tmp_path)
+        db_path = tmp_path / "fp.json"
+
+        _run(registry, db_path)
+        src.write_text("howdy")
+        _bump_mtime(src)
+        _run(registry, db_path)
+        assert runs == ["build", "build"]
+
+    def test_missing_output_still_runs(self, tmp_path: Path) -> None:
+        registry, _, out, runs = self._setup(tmp_path)
+        db_path = tmp_path / "fp.json"
+
+        _run(registry, db_path)
+        out.unlink()
+        _run(registry, db_path)
+        assert runs == ["build", "build"]
+
+    def test_refreshes_mtime_after_hash_match(self, tmp_path: Path) -> None:
+        registry, src, _, _ = self._setup(tmp_path)
+        db_path = tmp_path / "fp.json"
+        task = registry.get("build")
+        assert task is not None
+
+        _run(registry, db_path)
+        _bump_mtime(src)
+
+        db = FingerprintDB(db_path)
+        assert db.unchanged(task) is True
+        db.save()
+
+        stored = json.loads(db_path.read_text())
+        assert stored["build"][str(src)][1] == src.stat().st_mtime_ns
+
+    def test_unrecorded_run_drops_stale_record(self, tmp_path: Path) -> None:
+        registry, src, out, runs = self._setup(tmp_path)
+        db_path = tmp_path / "fp.json"
+
+        _run(registry, db_path)
+        src.write_text("howdy")
+        _bump_mtime(src)
+        # A run without content hashing rebuilds from the edited input
+        db = FingerprintDB(db_path, check=False)
+        Executor(registry, verbose=False, fingerprints=db).run("build")
+        assert out.read_text() == "HOWDY"
+
+        # Reverting the edit must not match the first run's record
+        src.write_text("hello")
+        _bump_mtime(src, 20)
+        _run(registry, db_path)
+        assert runs == ["build", "build", "build"]
+        assert out.read_text() == "HELLO"
+
+    def test_phony_task_is_never_unchanged(self, tmp_path: Path) -> None:
+        src = tmp_path / "src.txt"
+        src.write_text("x")
+        registry = TaskRegistry()
+        task = registry.register(lambda: None, name="lint", inputs=[src])
+
+        db = FingerprintDB(tmp_path / "fp.json")
+        db.record(task)
+        assert db.unchanged(task) is False
+
+    def test_corrupt_database_is_ignored(self, tmp_path: Path) -> None:
+        registry, _, _, _ = self._setup(tmp_path)
+        db_path = tmp_path / "fp.json"
+        db_path.write_text("{not json")
+        task = registry.get("build")
+        assert task is not None
+
+        assert FingerprintDB(db_path).unchanged(task) is False
+
+    def test_save_is_noop_when_clean(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "fp.json"
+        FingerprintDB(db_path).save()
+        assert not db_path.exists()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable, Iterator
+
 from .task import Task, TaskRegistry
 
 
@@ -14,84 +17,282 @@ class CyclicDependencyError(Exception):
         super().__init__(f"Cyclic dependency detected: {cycle_str}")
 
 
+def _strongly_connected(
+    tasks: list[Task], deps: dict[Task, list[Task]]
+) -> list[list[Task]]:
+    """Strongly connected components of the task graph, in any order."""
+    try:
+        import rustworkx  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return _tarjan(tasks, deps)
+
+    graph = rustworkx.PyDiGraph()
+    node_ids = graph.add_nodes_from(tasks)
+    ids = dict(zip(tasks, node_ids))
+    graph.add_edges_from_no_data([(ids[t], ids[d]) for t in tasks for d in deps[t]])
+    return [
+        [graph[i] for i in component]
+        for component in rustworkx.strongly_connected_components(graph)
+    ]
+
+
+def _tarjan(tasks: list[Task], deps: dict[Task, list[Task]]) -> list[list[Task]]:
+    """Tarjan's algorithm, iterative so deep graphs don't hit the recursion limit."""
+    index: dict[Task, int] = {}
+    lowlink: dict[Task, int] = {}
+    on_stack: set[Task] = set()
+    stack: list[Task] = []
+    components: list[list[Task]] = []
+
+    for root in tasks:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(deps[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(deps[child])))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: list[Task] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member is node:
+                            break
+                    components.append(component)
+
+    return components
+
+
 class DependencyResolver:
     """Resolves task dependencies and detects cycles."""
 
     def __init__(self, registry: TaskRegistry) -> None:
+        registry.finalize()
         self.registry = registry
+        self._transitive_deps: dict[str, frozenset[str]] = {}
+        self._transitive_dependents: dict[str, frozenset[str]] = {}
+        self._resolved: dict[Task, tuple[Task, ...]] = {}
+        self._reverse: dict[Task, list[Task]] | None = None
+        self._task_ids: dict[Task, int] | None = None
+        self._deps_masks: dict[Task, int] = {}
+        self._cache_version = registry.version
+
+    def _fresh_caches(self) -> None:
+        """Drop memoized results if the registry changed since they were built."""
+        if self._cache_version != self.registry.version:
+            self.registry.finalize()
+            self._transitive_deps.clear()
+            self._transitive_dependents.clear()
+            self._resolved.clear()
+            self._reverse = None
+            self._task_ids = None
+            self._deps_masks.clear()
+            self._cache_version = self.registry.version
 
     def dependencies(self, task: Task) -> list[Task]:
         """Get immediate task dependencies based on input files and depends."""
-        deps = []
-        seen = set()
+        deps: list[Task] = []
+        seen: set[Task] = {task}
 
         # Task dependencies (from depends field)
         for dep_name in task.depends:
-            if dep_name not in seen:
-                dep_task = self.registry.get(dep_name)
-                if dep_task and dep_task.name != task.name:
-                    deps.append(dep_task)
-                    seen.add(dep_name)
+            dep_task = self.registry.get(dep_name)
+            if dep_task and dep_task not in seen:
+                deps.append(dep_task)
+                seen.add(dep_task)
 
-        # File-based dependencies
-        for input_path in task.inputs:
+        # File-based dependencies (registered tasks carry absolute input paths)
+        for input_path in task.resolved_inputs or task.inputs:
             dep_task = self.registry.by_output(input_path)
-            if dep_task and dep_task.name != task.name and dep_task.name not in seen:
+            if dep_task and dep_task not in seen:
                 deps.append(dep_task)
-                seen.add(dep_task.name)
+                seen.add(dep_task)
 
         return deps
 
     def transitive_deps(self, task: Task) -> set[str]:
-        """Get all tasks transitively reachable from a task (inclusive)."""
-        result: set[str] = set()
+        """Get all tasks transitively reachable from a task (inclusive).
 
-        def visit(t: Task) -> None:
-            if t.name in result:
-                return
-            result.add(t.name)
-            for dep in self.dependencies(t):
-                visit(dep)
+        Results are memoized per task name until the registry changes.
+        """
+        self._fresh_caches()
+        return set(self._closure(task, self.dependencies, self._transitive_deps))
 
-        visit(task)
-        return result
+    def task_id(self, task: Task) -> int:
+        """Dense integer id of a registered task (its registration index).
+
+        Ids index the bitmasks from :meth:`transitive_deps_mask`; they are
+        reassigned when the registry changes.
+        """
+        self._fresh_caches()
+        if self._task_ids is None:
+            self._task_ids = {t: i for i, t in enumerate(self.registry.all_tasks())}
+        return self._task_ids[task]
+
+    def transitive_deps_mask(self, task: Task) -> int:
+        """:meth:`transitive_deps` as a bitmask over :meth:`task_id` bits."""
+        self._fresh_caches()
+        mask = self._deps_masks.get(task)
+        if mask is None:
+            mask = 0
+            for name in self._closure(task, self.dependencies, self._transitive_deps):
+                dep = self.registry.get(name)
+                if dep is not None:
+                    mask |= 1 << self.task_id(dep)
+            self._deps_masks[task] = mask
+        return mask
 
     def dependents(self, task: Task) -> list[Task]:
         """Get immediate tasks that depend on this task.
 
         Returns all tasks that list this task in their dependencies
-        (either via Task.depends or by consuming outputs).
+        (either via Task.depends or by consuming outputs), in registration
+        order.
         """
-        dependents: list[Task] = []
-        seen: set[str] = set()
+        self._fresh_caches()
+        if self._reverse is None:
+            # One pass over every task's edges serves all later queries
+            reverse: dict[Task, list[Task]] = {}
+            for candidate in self.registry.all_tasks():
+                for dep in self.dependencies(candidate):
+                    reverse.setdefault(dep, []).append(candidate)
+            self._reverse = reverse
+        return list(self._reverse.get(task, ()))
 
-        for candidate in self.registry.all_tasks():
-            if candidate.name == task.name:
-                continue
+    def transitive_dependents(self, task: Task) -> set[str]:
+        """Get all tasks that transitively depend on this task (inclusive).
 
-            # Check if candidate depends on this task
-            deps = self.dependencies(candidate)
-            dep_names = {d.name for d in deps}
+        The first query computes every task's closure at once with
+        :meth:`transitive_closure_dependents`; later ones are lookups until
+        the registry changes.
+        """
+        self._fresh_caches()
+        cached = self._transitive_dependents.get(task.name)
+        if cached is None:
+            cached = self.transitive_closure_dependents().get(task.name)
+        if cached is None:
+            # Not a registered task, so not part of the whole-graph pass
+            cached = self._closure(task, self.dependents, self._transitive_dependents)
+        return set(cached)
+
+    def transitive_dependent_tasks(self, task: Task) -> list[Task]:
+        """Tasks that transitively depend on *task* (inclusive), as Tasks.
+
+        Ordered so every task comes after the ones it depends on within the
+        set (reverse postorder over the dependents index); *task* is first.
+        """
+        postorder: list[Task] = []
+        visited: set[Task] = {task}
+        stack = [(task, iter(self.dependents(task)))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(self.dependents(child))))
+                    break
+            else:
+                stack.pop()
+                postorder.append(node)
+
+        postorder.reverse()
+        return postorder
+
+    def transitive_closure_dependents(self) -> dict[str, frozenset[str]]:
+        """Map every task name to its transitive dependents (inclusive).
+
+        Computed for the whole graph at once. Tasks are visited in reverse
+        topological order (Kahn), and each task's closure is the union of its
+        direct dependents' closures. The sets are int bitmasks keyed by
+        registration index, so each union is one big-int OR. The results go
+        into :meth:`transitive_dependents`'s memo. If the graph has a cycle,
+        every task falls back to the per-task walk.
+        """
+        self._fresh_caches()
+        tasks = self.registry.all_tasks()
+        index = {t: i for i, t in enumerate(tasks)}
+        indegree = {t: len(self.dependencies(t)) for t in tasks}
+        ready = deque(t for t in tasks if indegree[t] == 0)
+        order: list[Task] = []
+        while ready:
+            t = ready.popleft()
+            order.append(t)
+            for dependent in self.dependents(t):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(tasks):
+            return {
+                t.name: self._closure(t, self.dependents, self._transitive_dependents)
+                for t in tasks
+            }
+
+        masks: dict[Task, int] = {}
+        for t in reversed(order):
+            mask = 1 << index[t]
+            for dependent in self.dependents(t):
+                mask |= masks[dependent]
+            masks[t] = mask
+
+        result: dict[str, frozenset[str]] = {}
+        for t, mask in masks.items():
+            names: list[str] = []
+            while mask:
+                low = mask & -mask
+                names.append(tasks[low.bit_length() - 1].name)
+                mask ^= low
+            result[t.name] = frozenset(names)
+        self._transitive_dependents.update(result)
+        return result
 
-            if task.name in dep_names and candidate.name not in seen:
-                dependents.append(candidate)
-                seen.add(candidate.name)
+    @staticmethod
+    def _closure(
+        task: Task,
+        neighbours: Callable[[Task], list[Task]],
+        cache: dict[str, frozenset[str]],
+    ) -> frozenset[str]:
+        """Names reachable from *task* via *neighbours*, memoized in *cache*.
 
-        return dependents
+        A neighbour whose closure is already cached contributes it whole
+        instead of being walked again.
+        """
+        cached = cache.get(task.name)
+        if cached is not None:
+            return cached
 
-    def transitive_dependents(self, task: Task) -> set[str]:
-        """Get all tasks that transitively depend on this task (inclusive)."""
         result: set[str] = set()
-
-        def visit(t: Task) -> None:
+        pending = [task]
+        while pending:
+            t = pending.pop()
             if t.name in result:
-                return
+                continue
+            known = cache.get(t.name)
+            if known is not None:
+                result.update(known)
+                continue
             result.add(t.name)
-            for dependent in self.dependents(t):
-                visit(dependent)
+            pending.extend(neighbours(t))
 
-        visit(task)
-        return result
+        cached = cache[task.name] = frozenset(result)
+        return cached
 
     def resolve(self, target: Task) -> list[Task]:
         """
@@ -99,46 +300,157 @@ class DependencyResolver:
 
         Returns tasks in execution order (dependencies first).
         Raises CyclicDependencyError if a cycle is detected.
-        """
-        result: list[Task] = []
-        visited: set[str] = set()
-        in_stack: set[str] = set()
-        stack: list[str] = []
 
-        def visit(task: Task) -> None:
-            if task.name in visited:
-                return
+        The order is memoized per target until the registry changes, so a
+        doctor check followed by a run resolves the graph once.
+        """
+        self._fresh_caches()
+        cached = self._resolved.get(target)
+        if cached is not None:
+            return list(cached)
 
-            if task.name in in_stack:
-                # Found a cycle - extract it
-                cycle_start = stack.index(task.name)
-                cycle = stack[cycle_start:] + [task.name]
-                raise CyclicDependencyError(cycle)
+        result = self._toposort([target])
+        self._resolved[target] = tuple(result)
+        return result
 
-            in_stack.add(task.name)
-            stack.append(task.name)
+    def iter_reachable(self, target: Task) -> Iterator[Task]:
+        """Yield every task reachable from *target* (itself included) once.
 
-            # Visit dependencies first
+        Reads the memoized resolve() order when there is one, without
+        copying it; otherwise walks the graph depth-first with an explicit
+        stack, in no particular order. Cycles are not reported.
+        """
+        self._fresh_caches()
+        cached = self._resolved.get(target)
+        if cached is not None:
+            yield from cached
+            return
+
+        seen = {target}
+        pending = [target]
+        while pending:
+            task = pending.pop()
+            yield task
             for dep in self.dependencies(task):
-                visit(dep)
+                if dep not in seen:
+                    seen.add(dep)
+                    pending.append(dep)
 
-            stack.pop()
-            in_stack.remove(task.name)
-            visited.add(task.name)
-            result.append(task)
+    def _toposort(self, targets: list[Task]) -> list[Task]:
+        """One depth-first pass over the union of *targets*' dependencies.
 
-        visit(target)
+        Iterative (an explicit stack of dependency iterators), so deep
+        chains neither pay per-level frame setup nor hit the recursion
+        limit; the postorder is the same as a recursive walk's.
+
+        Targets whose order is already memoized are spliced in instead of
+        walked; their closure is complete, so the splice stays valid.
+        """
+        result: list[Task] = []
+        visited: set[Task] = set()
+        in_stack: set[Task] = set()
+        path: list[Task] = []
+        stack: list[Iterator[Task]] = []
+
+        def enter(task: Task) -> None:
+            in_stack.add(task)
+            path.append(task)
+            stack.append(iter(self.dependencies(task)))
+
+        for target in targets:
+            cached = self._resolved.get(target)
+            if cached is None:
+                if target in visited:
+                    continue
+                enter(target)
+                while stack:
+                    # Visit dependencies first
+                    for dep in stack[-1]:
+                        if dep in visited:
+                            continue
+                        if dep in in_stack:
+                            # Found a cycle - extract it
+                            cycle_start = path.index(dep)
+                            cycle = [t.name for t in path[cycle_start:]] + [dep.name]
+                            raise CyclicDependencyError(cycle)
+                        enter(dep)
+                        break
+                    else:
+                        stack.pop()
+                        task = path.pop()
+                        in_stack.remove(task)
+                        visited.add(task)
+                        result.append(task)
+                continue
+            for task in cached:
+                if task not in visited:
+                    visited.add(task)
+                    result.append(task)
         return result
 
+    def find_all_cycles(self) -> list[list[str]]:
+        """Find every dependency cycle in the registry in one pass.
+
+        Groups all tasks into strongly connected components (native
+        rustworkx when installed, else Tarjan's algorithm in Python).
+        Returns one cycle per multi-task component, written like
+        :attr:`CyclicDependencyError.cycle` (``[a, b, a]``) and starting from
+        the component's first-registered task.
+        """
+        tasks = self.registry.all_tasks()
+        deps = {t: self.dependencies(t) for t in tasks}
+        order = {t: i for i, t in enumerate(tasks)}
+
+        components = [c for c in _strongly_connected(tasks, deps) if len(c) > 1]
+        components.sort(key=lambda c: min(order[t] for t in c))
+        return [self._cycle_in(c, deps, order) for c in components]
+
+    @staticmethod
+    def _cycle_in(
+        component: list[Task],
+        deps: dict[Task, list[Task]],
+        order: dict[Task, int],
+    ) -> list[str]:
+        """Shortest cycle through the first-registered task of a component."""
+        members = set(component)
+        start = min(component, key=order.__getitem__)
+        parent: dict[Task, Task] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for dep in deps[node]:
+                if dep is start:
+                    path = [node]
+                    while path[-1] is not start:
+                        path.append(parent[path[-1]])
+                    return [t.name for t in [*reversed(path), start]]
+                if dep in members and dep not in parent:
+                    parent[dep] = node
+                    queue.append(dep)
+        raise AssertionError("strongly connected component without a cycle")
+
+    def resolve_many(self, targets: list[Task]) -> list[Task]:
+        """Resolve several targets into one execution order.
+
+        Shared dependencies appear once, every task after its dependencies.
+        The union is walked in a single pass, so redo's many dependents
+        don't each re-list the same upstream tasks. The order matches
+        concatenating each target's resolve() order and dropping repeats.
+        """
+        self._fresh_caches()
+        if len(targets) == 1:
+            return self.resolve(targets[0])
+        return self._toposort(targets)
+
     def build_dependency_graph(self, target: Task) -> dict[str, list[str]]:
         """Build a dependency graph for visualization."""
         graph: dict[str, list[str]] = {}
-        visited: set[str] = set()
+        visited: set[Task] = set()
 
         def visit(task: Task) -> None:
-            if task.name in visited:
+            if task in visited:
                 return
-            visited.add(task.name)
+            visited.add(task)
 
             deps = self.dependencies(task)
             graph[task.name] = [d.name for d in deps]
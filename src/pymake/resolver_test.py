@@ -1,5 +1,7 @@
 """Tests for resolver.py."""
 
+import sys
+
 import pytest
 
 from pymake import CyclicDependencyError, DependencyResolver, TaskRegistry
@@ -64,6 +66,41 @@ class TestDependencyResolver:
             resolver.resolve(task)
         assert "a" in exc_info.value.cycle
 
+    def test_resolve_deep_chain_without_recursion_limit(self) -> None:
+        registry = TaskRegistry()
+        depth = sys.getrecursionlimit() + 100
+        for i in range(depth):
+            inputs = [f"t{i - 1}.txt"] if i else []
+            registry.register(
+                lambda: None, name=f"t{i}", inputs=inputs, outputs=[f"t{i}.txt"]
+            )
+        resolver = DependencyResolver(registry)
+        first = registry.get("t0")
+        last = registry.get(f"t{depth - 1}")
+        assert first is not None and last is not None
+
+        assert len(resolver.resolve(last)) == depth
+        assert len(resolver.transitive_dependent_tasks(first)) == depth
+
+    def test_find_all_cycles(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="x", inputs=["a.txt"], outputs=["x.txt"])
+        registry.register(lambda: None, name="a", inputs=["c.txt"], outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["b.txt"], outputs=["c.txt"])
+        registry.register(lambda: None, name="p", inputs=["q.txt"], outputs=["p.txt"])
+        registry.register(lambda: None, name="q", inputs=["p.txt"], outputs=["q.txt"])
+        registry.register(lambda: None, name="ok", inputs=["x.txt"])
+        resolver = DependencyResolver(registry)
+
+        assert resolver.find_all_cycles() == [["a", "c", "b", "a"], ["p", "q", "p"]]
+
+    def test_find_all_cycles_acyclic(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"])
+        assert DependencyResolver(registry).find_all_cycles() == []
+
     def test_to_dot_simple(self) -> None:
         registry = TaskRegistry()
         registry.register(lambda: None, name="build", outputs=["out.txt"])
@@ -134,6 +171,18 @@ class TestDependencyResolver:
         dependents = resolver.dependents(task_b)
         assert dependents == []
 
+    def test_dependents_index_tracks_registry_version(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"])
+        resolver = DependencyResolver(registry)
+        task_a = registry.get("a")
+        assert task_a is not None
+        assert [t.name for t in resolver.dependents(task_a)] == ["b"]
+
+        registry.register(lambda: None, name="c", inputs=["a.txt"])
+        assert [t.name for t in resolver.dependents(task_a)] == ["b", "c"]
+
     def test_transitive_dependents(self) -> None:
         """Test finding all tasks that transitively depend on a task."""
         registry = TaskRegistry()
@@ -173,3 +222,154 @@ class TestDependencyResolver:
         assert task_b is not None
         trans_deps_b = resolver.transitive_dependents(task_b)
         assert trans_deps_b == {"b", "d"}
+
+    def test_transitive_deps_memoized_copy(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        resolver = DependencyResolver(registry)
+        task_b = registry.get("b")
+        assert task_b is not None
+
+        first = resolver.transitive_deps(task_b)
+        assert first == {"a", "b"}
+
+        # Mutating a returned set must not poison the cache
+        first.add("zzz")
+        assert resolver.transitive_deps(task_b) == {"a", "b"}
+
+    def test_transitive_deps_mask(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["a.txt"])
+        resolver = DependencyResolver(registry)
+        task_a = registry.get("a")
+        task_c = registry.get("c")
+        assert task_a is not None and task_c is not None
+
+        assert resolver.task_id(task_c) == 2
+        mask = resolver.transitive_deps_mask(task_c)
+        assert mask == (1 << resolver.task_id(task_a)) | (1 << resolver.task_id(task_c))
+
+    def test_transitive_deps_cache_tracks_registry_version(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        resolver = DependencyResolver(registry)
+        task_b = registry.get("b")
+        assert task_b is not None
+        assert resolver.transitive_deps(task_b) == {"b"}
+
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        assert resolver.transitive_deps(task_b) == {"a", "b"}
+
+    def test_transitive_dependents_reuses_cached_closures(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["b.txt"])
+        resolver = DependencyResolver(registry)
+        task_a = registry.get("a")
+        task_b = registry.get("b")
+        assert task_a is not None and task_b is not None
+
+        assert resolver.transitive_dependents(task_b) == {"b", "c"}
+        assert resolver.transitive_dependents(task_a) == {"a", "b", "c"}
+
+        registry.register(lambda: None, name="d", inputs=["b.txt"])
+        assert resolver.transitive_dependents(task_a) == {"a", "b", "c", "d"}
+
+    def test_transitive_dependent_tasks_in_dependency_order(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(
+            lambda: None, name="d", inputs=["b.txt", "c.txt"], outputs=["d.txt"]
+        )
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["b.txt"], outputs=["c.txt"])
+        resolver = DependencyResolver(registry)
+        task_a = registry.get("a")
+        assert task_a is not None
+
+        names = [t.name for t in resolver.transitive_dependent_tasks(task_a)]
+        assert names == ["a", "b", "c", "d"]
+
+    def test_transitive_closure_dependents(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["a.txt"], outputs=["c.txt"])
+        registry.register(lambda: None, name="d", inputs=["b.txt", "c.txt"])
+        resolver = DependencyResolver(registry)
+
+        closure = resolver.transitive_closure_dependents()
+        assert closure == {
+            "a": {"a", "b", "c", "d"},
+            "b": {"b", "d"},
+            "c": {"c", "d"},
+            "d": {"d"},
+        }
+        task_b = registry.get("b")
+        assert task_b is not None
+        assert resolver.transitive_dependents(task_b) == {"b", "d"}
+
+    def test_transitive_closure_dependents_with_cycle(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", inputs=["b.txt"], outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["a.txt"])
+        resolver = DependencyResolver(registry)
+
+        closure = resolver.transitive_closure_dependents()
+        assert closure["a"] == {"a", "b", "c"}
+        assert closure["c"] == {"c"}
+
+    def test_resolve_many_matches_concatenated_resolves(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["a.txt"], outputs=["c.txt"])
+        registry.register(lambda: None, name="d", inputs=["b.txt", "c.txt"])
+        resolver = DependencyResolver(registry)
+        task_c = registry.get("c")
+        task_d = registry.get("d")
+        assert task_c is not None and task_d is not None
+
+        resolver.resolve(task_c)  # memoized targets are spliced in
+        names = [t.name for t in resolver.resolve_many([task_c, task_d])]
+        assert names == ["a", "c", "b", "d"]
+
+    def test_resolve_memoized_until_registry_changes(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        resolver = DependencyResolver(registry)
+        task_b = registry.get("b")
+        assert task_b is not None
+
+        first = resolver.resolve(task_b)
+        first.clear()
+        assert [t.name for t in resolver.resolve(task_b)] == ["b"]
+
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        assert [t.name for t in resolver.resolve(task_b)] == ["a", "b"]
+
+    def test_iter_reachable_yields_each_task_once(self) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=["a.txt"])
+        registry.register(lambda: None, name="b", inputs=["a.txt"], outputs=["b.txt"])
+        registry.register(lambda: None, name="c", inputs=["a.txt"], outputs=["c.txt"])
+        registry.register(lambda: None, name="d", inputs=["b.txt", "c.txt"])
+        registry.register(lambda: None, name="other")
+        resolver = DependencyResolver(registry)
+        task_d = registry.get("d")
+        assert task_d is not None
+
+        names = [t.name for t in resolver.iter_reachable(task_d)]
+        assert sorted(names) == ["a", "b", "c", "d"]
+        resolver.resolve(task_d)
+        assert [t.name for t in resolver.iter_reachable(task_d)] == [
+            "a",
+            "b",
+            "c",
+            "d",
+        ]
@@ -29,6 +29,10 @@ def sh(cmd: str | list[str], capture: bool = False, check: bool = True) -> str:
         >>> sh('exit 1', check=False)  # won't raise
         ''
     """
+    # No preexec_fn, process_group, or user/group switching: that keeps
+    # CPython on its vfork() launch path (3.10+, Linux), which already avoids
+    # copying the parent's page tables. A new process group would also take
+    # the child out of the terminal's foreground group and break Ctrl-C.
     result = subprocess.run(
         cmd,
         shell=isinstance(cmd, str),
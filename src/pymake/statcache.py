@@ -0,0 +1,124 @@
+"""Per-run filesystem metadata cache.
+
+``Task.should_run`` needs to know, for every declared input and output,
+whether the file exists and what its mtime is. A :class:`StatCache` answers
+both with a single ``os.stat`` per path (instead of ``exists()`` followed by
+``stat()``) and memoizes the result, so tasks that share inputs don't re-stat
+the same file.
+
+An :class:`~pymake.executor.Executor` owns one cache and clears it at the
+start of every ``run()`` and again after every task body it runs. A task may
+rewrite files besides its declared outputs (a phony formatter rewriting
+sources, say), so only tasks that were skipped share stats with each other.
+
+:meth:`StatCache.prefetch` fills the cache for several sibling paths with one
+``os.scandir`` of their shared parent. On Windows the ``DirEntry`` carries
+the stat data for free; on POSIX ``DirEntry.stat()`` is still one
+``fstatat`` per entry, but relative to the already-open directory.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+__all__ = ["StatCache"]
+
+# Below this many paths a thread pool costs more to start than it saves
+_PARALLEL_STAT_MIN = 64
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+class StatCache:
+    """Memoize ``os.stat`` results keyed by ``Path``.
+
+    Missing files are cached as ``None``. Paths are used as given — no
+    ``resolve()`` — so ``a.txt`` and ``./a.txt`` share an entry (``Path``
+    normalizes them) but a symlink and its target do not.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[Path, os.stat_result | None] = {}
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        """Return the stat result for *path*, or ``None`` if it is missing."""
+        try:
+            return self._stats[path]
+        except KeyError:
+            pass
+        st = self._stats[path] = _stat_or_none(path)
+        return st
+
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        """Stat uncached *paths* that share a parent with one ``os.scandir``.
+
+        Parents with a single uncached path are left to :meth:`stat`. Names
+        that don't show up in the listing aren't cached as missing (the
+        filesystem may be case-insensitive), so :meth:`stat` decides those.
+        """
+        by_parent: defaultdict[Path, dict[str, Path]] = defaultdict(dict)
+        for path in paths:
+            if path in self._stats or path.name in ("", ".", ".."):
+                continue
+            by_parent[path.parent][path.name] = path
+
+        for parent, wanted in by_parent.items():
+            if len(wanted) < 2:
+                continue
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        found = wanted.get(entry.name)
+                        if found is None:
+                            continue
+                        try:
+                            self._stats[found] = entry.stat()
+                        except FileNotFoundError:
+                            self._stats[found] = None
+            except (FileNotFoundError, NotADirectoryError):
+                for path in wanted.values():
+                    self._stats[path] = None
+            except OSError:
+                continue
+
+    def stat_many(self, paths: Iterable[Path]) -> None:
+        """Stat every uncached path in *paths*.
+
+        Large batches are spread over a thread pool. ``os.stat`` releases
+        the GIL, so on a cold cache or a network filesystem the calls'
+        latencies overlap instead of adding up.
+        """
+        todo = [p for p in dict.fromkeys(paths) if p not in self._stats]
+        if len(todo) < _PARALLEL_STAT_MIN:
+            for path in todo:
+                self.stat(path)
+            return
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            self._stats.update(zip(todo, pool.map(_stat_or_none, todo)))
+
+    def mtime(self, path: Path) -> float | None:
+        """Return the mtime of *path*, or ``None`` if it is missing."""
+        st = self.stat(path)
+        return None if st is None else st.st_mtime
+
+    def exists(self, path: Path) -> bool:
+        """Return ``True`` if *path* exists."""
+        return self.stat(path) is not None
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        """Forget cached results for *paths* (e.g. after a task rewrote them)."""
+        for path in paths:
+            self._stats.pop(path, None)
+
+    def clear(self) -> None:
+        """Forget all cached results."""
+        self._stats.clear()
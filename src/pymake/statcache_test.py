@@ -0,0 +1,89 @@
+"""Tests for statcache.py."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from pymake.statcache import StatCache
+
+
+class TestStatCache:
+    def test_missing_file_is_none(self, tmp_path: Path) -> None:
+        cache = StatCache()
+        assert cache.stat(tmp_path / "missing.txt") is None
+        assert cache.mtime(tmp_path / "missing.txt") is None
+        assert cache.exists(tmp_path / "missing.txt") is False
+
+    def test_missing_parent_is_none(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        f.write_text("x")
+        cache = StatCache()
+        assert cache.mtime(f / "child.txt") is None
+
+    def test_existing_file_mtime(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        f.write_text("x")
+        cache = StatCache()
+        assert cache.mtime(f) == os.stat(f).st_mtime
+        assert cache.exists(f) is True
+
+    def test_results_are_memoized(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        cache = StatCache()
+        assert cache.exists(f) is False
+
+        f.write_text("x")
+        assert cache.exists(f) is False
+
+    def test_invalidate_forgets_entry(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        cache = StatCache()
+        assert cache.exists(f) is False
+
+        f.write_text("x")
+        cache.invalidate([f])
+        assert cache.exists(f) is True
+
+    def test_clear_forgets_everything(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        cache = StatCache()
+        assert cache.exists(f) is False
+
+        f.write_text("x")
+        cache.clear()
+        assert cache.exists(f) is True
+
+    def test_prefetch_sibling_outputs(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_text("a")
+        b.write_text("b")
+        cache = StatCache()
+        cache.prefetch([a, b, tmp_path / "missing.txt"])
+
+        # Served from the cache even after the files change on disk
+        a.unlink()
+        assert cache.mtime(b) == os.stat(b).st_mtime
+        assert cache.exists(a) is True
+        assert cache.exists(tmp_path / "missing.txt") is False
+
+    def test_prefetch_missing_parent(self, tmp_path: Path) -> None:
+        parent = tmp_path / "build"
+        cache = StatCache()
+        cache.prefetch([parent / "a.txt", parent / "b.txt"])
+
+        parent.mkdir()
+        (parent / "a.txt").write_text("a")
+        assert cache.exists(parent / "a.txt") is False
+
+    def test_stat_many_large_batch(self, tmp_path: Path) -> None:
+        paths = [tmp_path / f"{i}.txt" for i in range(100)]
+        for p in paths[::2]:
+            p.write_text("x")
+        cache = StatCache()
+        cache.stat_many(paths)
+
+        for p in paths[::2]:
+            p.unlink()
+        assert [cache.exists(p) for p in paths] == [True, False] * 50
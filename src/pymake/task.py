@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import dataclasses
 import inspect
+import os
+import sys
+import weakref
 from collections.abc import Callable, Sequence
 from pathlib import Path
 from types import UnionType
 from typing import Any, Union, get_args, get_origin, get_type_hints
 
+from .statcache import StatCache
+
 SUPPORTED_VAR_TYPES = {str, int, float, bool, Path}
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class TaskVar:
     """A variable extracted from a task function signature."""
 
@@ -24,11 +29,15 @@ class TaskVar:
 
 def _is_optional(annotation: Any) -> bool:
     """True if annotation is exactly T | None / Optional[T]."""
-    origin = get_origin(annotation)
-    if origin not in (Union, UnionType):
+    # T | None is a UnionType whose args are a plain attribute; only
+    # typing.Optional needs the get_origin/get_args machinery
+    if type(annotation) is UnionType:
+        args = annotation.__args__
+    elif get_origin(annotation) is Union:
+        args = get_args(annotation)
+    else:
         return False
 
-    args = get_args(annotation)
     if len(args) != 2:
         return False
 
@@ -44,27 +53,58 @@ def _unwrap_optional(annotation: Any) -> Any:
     return annotation
 
 
+# Signature inspection dominates register(); a function registered again
+# (e.g. into a second registry) reuses its vars
+_signature_vars: weakref.WeakKeyDictionary[Any, tuple[TaskVar, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def vars_from_signature(func: Callable[..., None]) -> tuple[TaskVar, ...]:
-    """Extract and validate task variables from function signature."""
+    """Extract and validate task variables from function signature.
+
+    Results are cached per function object.
+    """
+    try:
+        return _signature_vars[func]
+    except (KeyError, TypeError):
+        pass
+    result = _vars_from_signature(func)
+    try:
+        _signature_vars[func] = result
+    except TypeError:
+        pass  # not weak-referenceable
+    return result
+
+
+def _vars_from_signature(func: Callable[..., None]) -> tuple[TaskVar, ...]:
+    """Uncached body of vars_from_signature."""
     signature = inspect.signature(func)
-    type_hints = get_type_hints(func)
+    # String annotations (PEP 563) need evaluating in the function's
+    # globals; that costs more than the rest of the inspection, so it is
+    # done only when one shows up
+    type_hints: dict[str, Any] | None = None
     result: list[TaskVar] = []
+    # Bound once rather than looked up through the class per parameter
+    empty = inspect.Parameter.empty
+    variadic = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
 
     for param in signature.parameters.values():
-        if param.kind in (
-            inspect.Parameter.VAR_POSITIONAL,
-            inspect.Parameter.VAR_KEYWORD,
-        ):
+        if param.kind in variadic:
             raise ValueError(f"Task '{func.__name__}': *args/**kwargs not supported")
 
-        annotation: Any = type_hints.get(param.name, param.annotation)
+        annotation: Any = param.annotation
+        if isinstance(annotation, str):
+            if type_hints is None:
+                type_hints = get_type_hints(func)
+            annotation = type_hints.get(param.name, annotation)
         is_optional = False
 
-        if annotation is not inspect.Parameter.empty and _is_optional(annotation):
+        if annotation is not empty and _is_optional(annotation):
             annotation = _unwrap_optional(annotation)
             is_optional = True
 
-        if annotation is inspect.Parameter.empty:
+        if annotation is empty:
             annotation = str
 
         if annotation not in SUPPORTED_VAR_TYPES:
@@ -73,7 +113,7 @@ def vars_from_signature(func: Callable[..., None]) -> tuple[TaskVar, ...]:
                 f"for var '{param.name}'"
             )
 
-        if param.default is inspect.Parameter.empty:
+        if param.default is empty:
             if not is_optional:
                 raise ValueError(
                     f"Task '{func.__name__}': var '{param.name}' "
@@ -95,9 +135,12 @@ def vars_from_signature(func: Callable[..., None]) -> tuple[TaskVar, ...]:
     return tuple(result)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(eq=False, slots=True)
 class Task:
-    """A build task with inputs, outputs, and execution function."""
+    """A build task with inputs, outputs, and execution function.
+
+    Tasks compare and hash by identity; a registry holds one per name.
+    """
 
     name: str
     func: Callable[..., None]
@@ -109,14 +152,29 @@ class Task:
     doc: str | None = None
     touch: Path | None = None
     depends: tuple[str, ...] = ()
+    # Absolute (not symlink-resolved) paths, filled in by TaskRegistry.register
+    # so output lookups are plain dict hits
+    resolved_inputs: tuple[Path, ...] = ()
+    resolved_outputs: tuple[Path, ...] = ()
+    # Built from vars once, for VarsResolver's per-name lookups
+    vars_by_name: dict[str, TaskVar] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.vars_by_name = {var.name: var for var in self.vars}
 
     @property
     def is_phony(self) -> bool:
         """Task is phony if it has no outputs (always runs)."""
         return len(self.outputs) == 0
 
-    def should_run(self, force: bool = False) -> bool:
-        """Determine if this task should run based on file timestamps."""
+    def should_run(
+        self, force: bool = False, stat_cache: StatCache | None = None
+    ) -> bool:
+        """Determine if this task should run based on file timestamps.
+
+        Pass a shared ``stat_cache`` to avoid re-statting files that other
+        tasks have already looked at since the cache was last cleared.
+        """
         if force:
             return True
 
@@ -124,21 +182,29 @@ class Task:
         if self.is_phony:
             return True
 
-        # Check if any output is missing
+        cache = stat_cache if stat_cache is not None else StatCache()
+        # Outputs tend to be siblings (build/.*-check); inputs often live in
+        # large source directories where a listing would cost more than it saves.
+        cache.prefetch(self.outputs)
+
+        # Any missing output forces a run; otherwise track the oldest mtime
+        oldest_output: float | None = None
         for out in self.outputs:
-            if not out.exists():
+            mtime = cache.mtime(out)
+            if mtime is None:
                 return True
+            if oldest_output is None or mtime < oldest_output:
+                oldest_output = mtime
 
         # No inputs = only run if output doesn't exist (already checked above)
         if not self.inputs:
             return False
 
-        # Get the oldest output mtime
-        oldest_output = min(out.stat().st_mtime for out in self.outputs)
-
         # Check if any input is newer than the oldest output
+        assert oldest_output is not None
         for inp in self.inputs:
-            if inp.exists() and inp.stat().st_mtime > oldest_output:
+            mtime = cache.mtime(inp)
+            if mtime is not None and mtime > oldest_output:
                 return True
 
         return False
@@ -149,8 +215,24 @@ class TaskRegistry:
 
     def __init__(self) -> None:
         self._tasks: dict[str, Task] = {}
-        self._output_to_task: dict[Path, str] = {}
+        # Keyed by absolute path string; registration does no syscalls.
+        # Symlink aliases are handled by the lazy realpath index.
+        self._output_to_task: dict[str, str] = {}
+        self._realpath_index: dict[str, str] | None = None
+        # Source inputs miss the output map on every dependency lookup;
+        # remember their realpath instead of re-walking symlinks each time
+        self._realpath_cache: dict[str, str] = {}
+        # find_target answers (misses included) until the registry changes
+        self._find_cache: dict[str, Task | None] = {}
         self._default: str | None = None
+        self._version = 0
+        # Registry version finalize() last checked, so queries can call it freely
+        self._finalized_version = -1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever tasks are added or cleared."""
+        return self._version
 
     def default(self, name: str | Callable[..., None]) -> None:
         """Set the default task to run when no target is specified."""
@@ -175,29 +257,34 @@ class TaskRegistry:
         touch: str | Path | None = None,
     ) -> Task:
         """Register a task with the given parameters."""
-        task_name = name or func.__name__
+        # Names are looked up constantly (depends, CLI targets); interned
+        # keys let dict probes match on identity
+        task_name = sys.intern(name or func.__name__)
 
         # Separate callable inputs (task dependencies) from path inputs
         input_paths: list[Path] = []
         task_depends: list[str] = []
         for inp in inputs:
             if callable(inp):
-                task_depends.append(inp.__name__)
+                task_depends.append(sys.intern(inp.__name__))
             else:
-                input_paths.append(Path(inp))
+                input_paths.append(inp if isinstance(inp, Path) else Path(inp))
 
-        output_paths = tuple(Path(p) for p in outputs)
+        # Path(p) re-parses even when p is already a Path
+        output_paths = tuple(p if isinstance(p, Path) else Path(p) for p in outputs)
         touch_path = Path(touch) if touch else None
 
         # Touch file is also an output
         if touch_path:
             output_paths = (*output_paths, touch_path)
 
+        resolved_inputs = tuple(Path(os.path.abspath(p)) for p in input_paths)
+        resolved_outputs = tuple(Path(os.path.abspath(p)) for p in output_paths)
+
         # Check for output conflicts
-        for out in output_paths:
-            out_resolved = out.resolve()
-            if out_resolved in self._output_to_task:
-                existing = self._output_to_task[out_resolved]
+        for out, out_resolved in zip(output_paths, resolved_outputs):
+            existing = self._output_to_task.get(str(out_resolved))
+            if existing is not None:
                 raise ValueError(
                     f"Output file '{out}' is already produced by task '{existing}'. "
                     f"Cannot register task '{task_name}'."
@@ -217,6 +304,8 @@ class TaskRegistry:
             doc=func.__doc__,
             touch=touch_path,
             depends=tuple(task_depends),
+            resolved_inputs=resolved_inputs,
+            resolved_outputs=resolved_outputs,
         )
 
         if task_name in self._tasks:
@@ -225,9 +314,13 @@ class TaskRegistry:
         self._tasks[task_name] = task
 
         # Map outputs to task
-        for out in output_paths:
-            self._output_to_task[out.resolve()] = task_name
+        for out_resolved in resolved_outputs:
+            self._output_to_task[str(out_resolved)] = task_name
 
+        self._realpath_index = None
+        self._realpath_cache.clear()
+        self._find_cache.clear()
+        self._version += 1
         return task
 
     def __call__(
@@ -262,21 +355,78 @@ class TaskRegistry:
 
     def by_output(self, path: str | Path) -> Task | None:
         """Get a task that produces the given output file."""
-        resolved = Path(path).resolve()
-        task_name = self._output_to_task.get(resolved)
+        self.finalize()
+        key = os.fspath(path)
+        # Keys are absolute, so an absolute query needs no syscalls
+        task_name = self._output_to_task.get(key)
+        if task_name is None:
+            key = os.path.abspath(key)
+            task_name = self._output_to_task.get(key)
+        if task_name is None:
+            # Maybe the same file through a symlinked path
+            task_name = self._realpaths().get(self._realpath(key))
         if task_name:
             return self._tasks.get(task_name)
         return None
 
+    def _realpath(self, key: str) -> str:
+        """os.path.realpath, memoized until the registry changes."""
+        real = self._realpath_cache.get(key)
+        if real is None:
+            real = self._realpath_cache[key] = os.path.realpath(key)
+        return real
+
+    def _realpaths(self) -> dict[str, str]:
+        """Map realpath -> task name, built on the first lookup miss."""
+        if self._realpath_index is None:
+            self._realpath_index = {
+                self._realpath(key): name for key, name in self._output_to_task.items()
+            }
+        return self._realpath_index
+
+    def finalize(self) -> None:
+        """Reject outputs that are the same file through different paths.
+
+        register() only catches outputs with the same absolute path. Output
+        lookups and DependencyResolver run this before answering, so callers
+        rarely need to; it is a no-op until the registry changes again. Only
+        outputs sharing a basename are resolved, so the common no-collision
+        case costs no syscalls.
+        """
+        if self._finalized_version == self._version:
+            return
+        by_basename: dict[str, list[str]] = {}
+        for key in self._output_to_task:
+            by_basename.setdefault(os.path.basename(key), []).append(key)
+
+        for keys in by_basename.values():
+            if len(keys) < 2:
+                continue
+            owners: dict[str, str] = {}
+            for key in keys:
+                real = self._realpath(key)
+                existing = owners.setdefault(real, self._output_to_task[key])
+                if existing != self._output_to_task[key]:
+                    raise ValueError(
+                        f"Output file '{key}' is already produced by task "
+                        f"'{existing}'. Cannot register task "
+                        f"'{self._output_to_task[key]}'."
+                    )
+        self._finalized_version = self._version
+
     def find_target(self, target: str) -> Task | None:
         """Find a task by name or by output file."""
-        # First try by name
-        task = self.get(target)
-        if task:
-            return task
-
-        # Then try by output file
-        return self.by_output(target)
+        self.finalize()
+        target = sys.intern(target)
+        try:
+            return self._find_cache[target]
+        except KeyError:
+            pass
+
+        # First try by name, then by output file
+        task = self.get(target) or self.by_output(target)
+        self._find_cache[target] = task
+        return task
 
     def find_target_or_raise(self, target: str) -> Task:
         """Find a task by name or output file, raising ValueError if not found."""
@@ -299,7 +449,11 @@ class TaskRegistry:
         """Clear all registered tasks."""
         self._tasks.clear()
         self._output_to_task.clear()
+        self._realpath_index = None
+        self._realpath_cache.clear()
+        self._find_cache.clear()
         self._default = None
+        self._version += 1
 
 
 # Global task registry
@@ -27,6 +27,13 @@ class TestTask:
         )
         assert task.is_phony is False
 
+    def test_hash_and_eq_by_identity(self) -> None:
+        func = lambda: None  # noqa: E731
+        a = Task(name="test", func=func, inputs=(), outputs=())
+        b = Task(name="test", func=func, inputs=(), outputs=())
+        assert a != b
+        assert {a, b, a} == {a, b}
+
     def test_should_run_phony_always(self) -> None:
         task = Task(
             name="test",
@@ -131,10 +138,57 @@ class TestTaskRegistry:
         assert task is not None
         assert task.name == "build"
 
+    def test_register_stores_resolved_paths(self) -> None:
+        registry = TaskRegistry()
+        task = registry.register(
+            lambda: None, name="build", inputs=["in.txt"], outputs=["out.txt"]
+        )
+        assert task.resolved_inputs == (Path("in.txt").absolute(),)
+        assert task.resolved_outputs == (Path("out.txt").absolute(),)
+        assert registry.by_output(task.resolved_outputs[0]) is task
+
+    def test_by_output_through_symlinked_dir(self, tmp_path: Path) -> None:
+        real = tmp_path / "real"
+        real.mkdir()
+        (tmp_path / "link").symlink_to(real)
+        registry = TaskRegistry()
+        task = registry.register(lambda: None, name="build", outputs=[real / "out"])
+        assert registry.by_output(tmp_path / "link" / "out") is task
+
+    def test_by_output_memoizes_realpath_of_misses(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="build", outputs=[tmp_path / "out"])
+        registry.by_output(tmp_path / "src.c")
+
+        def fail(path: str) -> str:
+            raise AssertionError(f"realpath({path!r}) not memoized")
+
+        monkeypatch.setattr("os.path.realpath", fail)
+        assert registry.by_output(tmp_path / "src.c") is None
+
+    def test_finalize_rejects_symlink_aliased_outputs(self, tmp_path: Path) -> None:
+        real = tmp_path / "real"
+        real.mkdir()
+        (tmp_path / "link").symlink_to(real)
+        registry = TaskRegistry()
+        registry.register(lambda: None, name="a", outputs=[real / "out"])
+        registry.register(lambda: None, name="b", outputs=[tmp_path / "link" / "out"])
+        with pytest.raises(ValueError, match="already produced"):
+            registry.finalize()
+
     def test_find_target_not_found(self) -> None:
         registry = TaskRegistry()
         assert registry.find_target("nonexistent") is None
 
+    def test_find_target_cache_cleared_on_register(self) -> None:
+        registry = TaskRegistry()
+        assert registry.find_target("out.txt") is None
+        task = registry.register(lambda: None, name="build", outputs=["out.txt"])
+        assert registry.find_target("out.txt") is task
+        assert registry.find_target("build") is task
+
     def test_clear(self) -> None:
         registry = TaskRegistry()
         registry.register(lambda: None, name="test")
@@ -226,3 +280,23 @@ class TestTaskRegistry:
 
         with pytest.raises(ValueError, match=r"\*args/\*\*kwargs not supported"):
             registry.register(build)
+
+    def test_register_reuses_signature_vars(self) -> None:
+        def deploy(port: int = 8080) -> None:
+            pass
+
+        first = TaskRegistry().register(deploy)
+        second = TaskRegistry().register(deploy)
+        assert second.vars is first.vars
+
+    def test_register_resolves_string_annotations(self) -> None:
+        registry = TaskRegistry()
+
+        def deploy(env: "str | None" = None, port: "int" = 8080) -> None:
+            pass
+
+        task = registry.register(deploy)
+        assert [(v.type, v.is_optional) for v in task.vars] == [
+            (str, True),
+            (int, False),
+        ]
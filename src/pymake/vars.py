@@ -2,22 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TextIO
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover - Python 3.10 fallback
-    import tomli as tomllib  # type: ignore[no-redef]
-
 from .task import Task, TaskVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedVarsEntry:
     """Parsed --vars entry."""
 
@@ -41,14 +36,129 @@ def parse_vars_entry(entry: str) -> tuple[str, str | None, Any]:
             raise ValueError(f"Invalid --vars entry: {entry!r}")
         return (task_name, var_name, raw_value)
 
-    parsed = json.loads(raw_value)
-    if not isinstance(parsed, dict):
+    # Anything not starting with '{' can't be an object; skip the parser
+    parsed = _json_object(raw_value) if raw_value.lstrip().startswith("{") else None
+    if parsed is None:
         raise ValueError(
             f"Invalid --vars entry: {entry!r} (bulk value must be a JSON object)"
         )
     return (key, None, parsed)
 
 
+@functools.cache
+def _msgspec_object_decoder() -> Callable[[str], dict[str, Any] | None] | None:
+    """Build msgspec's JSON object decoder once; None if msgspec is missing."""
+    try:
+        import msgspec  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return None
+    decoder = msgspec.json.Decoder(dict)
+
+    def decode(raw: str) -> dict[str, Any] | None:
+        try:
+            return decoder.decode(raw)  # type: ignore[no-any-return, unused-ignore]
+        except msgspec.ValidationError:
+            return None
+
+    return decode
+
+
+def _json_object(raw: str) -> dict[str, Any] | None:
+    """Decode *raw* as JSON; None if it holds something other than an object.
+
+    Uses msgspec's native decoder when it is installed. Malformed JSON
+    raises ValueError either way.
+    """
+    decode = _msgspec_object_decoder()
+    if decode is not None:
+        return decode(raw)
+    import json
+
+    parsed = json.loads(raw)
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _bool_from_string(value: str) -> bool:
+    """Parse 'true'/'false' in any case."""
+    lowered = value.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    raise ValueError(value)
+
+
+def _expect(expected: type) -> Callable[[Any], Any]:
+    """Coercer passing through values of exactly type *expected*."""
+
+    def check(value: Any) -> Any:
+        if type(value) is not expected:
+            raise TypeError(value)
+        return value
+
+    return check
+
+
+def _float_from_typed(value: Any) -> float:
+    """Accept floats, widening ints."""
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
+    raise TypeError(value)
+
+
+def _str_from_typed(value: Any) -> str:
+    """Accept strings."""
+    if isinstance(value, str):
+        return value
+    raise TypeError(value)
+
+
+def _path_from_typed(value: Any) -> Path:
+    """Accept strings as paths."""
+    if isinstance(value, str):
+        return Path(value)
+    raise TypeError(value)
+
+
+def _parse_toml(raw: bytes) -> Any:
+    """Parse a TOML document, preferring rtoml's native parser if installed.
+
+    Parsers are imported here, not at module load: most runs have no
+    vars file, and tomllib alone is a noticeable slice of CLI startup.
+    """
+    try:
+        import rtoml  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        pass
+    else:
+        return rtoml.loads(raw.decode())
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:  # pragma: no cover - Python 3.10 fallback
+        import tomli as tomllib
+    return tomllib.loads(raw.decode())
+
+
+# Per-type coercers: _FROM_STRING for --vars task.var=value strings (raise
+# ValueError), _FROM_TYPED for vars file / JSON values (raise TypeError)
+_FROM_STRING: dict[type, Callable[[str], Any]] = {
+    str: str,
+    int: int,
+    float: float,
+    bool: _bool_from_string,
+    Path: Path,
+}
+_FROM_TYPED: dict[type, Callable[[Any], Any]] = {
+    str: _str_from_typed,
+    int: _expect(int),
+    float: _float_from_typed,
+    bool: _expect(bool),
+    Path: _path_from_typed,
+}
+
+
 class VarsResolver:
     """Resolve task vars from defaults, vars file, and --vars overrides."""
 
@@ -64,48 +174,49 @@ class VarsResolver:
         self.output = output or sys.stderr
         self._warned_unknown_tasks: set[str] = set()
         self._vars_file_values = self._load_vars_file(self.vars_file)
-        self._parsed_overrides = [self._parse_override(v) for v in self.vars_overrides]
+        # Parsed once and bucketed by task, in command-line order: resolve()
+        # only looks at one task's overrides, validate_tasks() at task names
+        self._overrides_by_task: dict[str, list[ParsedVarsEntry]] = {}
+        for raw in self.vars_overrides:
+            entry = self._parse_override(raw)
+            self._overrides_by_task.setdefault(entry.task_name, []).append(entry)
+        # Defaults overlaid with the vars file; fixed once the file is loaded
+        self._base_by_task: dict[Task, dict[str, Any]] = {}
 
     def validate_tasks(self, tasks: Sequence[Task]) -> None:
         """Validate task names in vars file and --vars entries."""
         known_task_names = {task.name for task in tasks}
 
+        warnings: list[str] = []
         for task_name in sorted(self._vars_file_values):
             if (
                 task_name not in known_task_names
                 and task_name not in self._warned_unknown_tasks
             ):
                 self._warned_unknown_tasks.add(task_name)
-                print(
-                    f"Warning: vars file has unknown task section [{task_name}]",
-                    file=self.output,
+                warnings.append(
+                    f"Warning: vars file has unknown task section [{task_name}]\n"
                 )
+        if warnings:
+            self.output.write("".join(warnings))
 
-        for entry in self._parsed_overrides:
-            if entry.task_name not in known_task_names:
+        # Buckets are in first-seen order, so this reports the first bad entry
+        for task_name, entries in self._overrides_by_task.items():
+            if task_name not in known_task_names:
                 raise ValueError(
-                    f"--vars entry {entry.original!r} references unknown task "
-                    f"'{entry.task_name}'"
+                    f"--vars entry {entries[0].original!r} references unknown task "
+                    f"'{task_name}'"
                 )
 
     def resolve(self, task: Task) -> dict[str, Any]:
         """Resolve kwargs for a task using defaults < vars file < --vars."""
-        resolved = {var.name: var.default for var in task.vars}
-        vars_by_name = {var.name: var for var in task.vars}
+        resolved = dict(self._base(task))
+        overrides = self._overrides_by_task.get(task.name)
+        if overrides is None:
+            return resolved
 
-        file_values = self._vars_file_values.get(task.name)
-        if file_values is not None:
-            self._apply_mapping(
-                task_name=task.name,
-                resolved=resolved,
-                vars_by_name=vars_by_name,
-                values=file_values,
-                source=f"vars file [{task.name}]",
-            )
-
-        for entry in self._parsed_overrides:
-            if entry.task_name != task.name:
-                continue
+        vars_by_name = task.vars_by_name
+        for entry in overrides:
             if entry.var_name is None:
                 self._apply_mapping(
                     task_name=task.name,
@@ -121,6 +232,25 @@ class VarsResolver:
 
         return resolved
 
+    def _base(self, task: Task) -> dict[str, Any]:
+        """Defaults < vars file for *task*, computed on first use."""
+        base = self._base_by_task.get(task)
+        if base is not None:
+            return base
+
+        base = {var.name: var.default for var in task.vars}
+        file_values = self._vars_file_values.get(task.name)
+        if file_values is not None:
+            self._apply_mapping(
+                task_name=task.name,
+                resolved=base,
+                vars_by_name=task.vars_by_name,
+                values=file_values,
+                source=f"vars file [{task.name}]",
+            )
+        self._base_by_task[task] = base
+        return base
+
     def _parse_override(self, entry: str) -> ParsedVarsEntry:
         task_name, var_name, value = parse_vars_entry(entry)
         return ParsedVarsEntry(
@@ -133,11 +263,11 @@ class VarsResolver:
     def _load_vars_file(self, path: Path | None) -> dict[str, dict[str, Any]]:
         if path is None:
             return {}
-        if not path.exists():
-            raise ValueError(f"Vars file not found: {path}")
-
-        with path.open("rb") as f:
-            data = tomllib.load(f)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            raise ValueError(f"Vars file not found: {path}") from None
+        data = _parse_toml(raw)
 
         if not isinstance(data, dict):
             raise ValueError(f"Invalid vars file: {path}")
@@ -186,31 +316,13 @@ class VarsResolver:
         return var
 
     def _coerce_from_string(self, task_name: str, var: TaskVar, value: str) -> Any:
-        target_type = var.type
-
-        if target_type is str:
-            return value
-        if target_type is int:
-            try:
-                return int(value)
-            except ValueError as e:
-                raise self._type_error(task_name, var, value) from e
-        if target_type is float:
-            try:
-                return float(value)
-            except ValueError as e:
-                raise self._type_error(task_name, var, value) from e
-        if target_type is bool:
-            lowered = value.lower()
-            if lowered == "true":
-                return True
-            if lowered == "false":
-                return False
-            raise self._type_error(task_name, var, value)
-        if target_type is Path:
-            return Path(value)
-
-        raise ValueError(f"Task '{task_name}': unsupported var type {target_type}")
+        coerce = _FROM_STRING.get(var.type)
+        if coerce is None:
+            raise ValueError(f"Task '{task_name}': unsupported var type {var.type}")
+        try:
+            return coerce(value)
+        except ValueError as e:
+            raise self._type_error(task_name, var, value) from e
 
     def _coerce_typed_value(self, task_name: str, var: TaskVar, value: Any) -> Any:
         if value is None:
@@ -218,31 +330,13 @@ class VarsResolver:
                 return None
             raise self._type_error(task_name, var, value)
 
-        target_type = var.type
-        if target_type is str:
-            if isinstance(value, str):
-                return value
-            raise self._type_error(task_name, var, value)
-        if target_type is int:
-            if type(value) is int:
-                return value
-            raise self._type_error(task_name, var, value)
-        if target_type is float:
-            if type(value) is float:
-                return value
-            if type(value) is int:
-                return float(value)
-            raise self._type_error(task_name, var, value)
-        if target_type is bool:
-            if isinstance(value, bool):
-                return value
-            raise self._type_error(task_name, var, value)
-        if target_type is Path:
-            if isinstance(value, str):
-                return Path(value)
-            raise self._type_error(task_name, var, value)
-
-        raise ValueError(f"Task '{task_name}': unsupported var type {target_type}")
+        coerce = _FROM_TYPED.get(var.type)
+        if coerce is None:
+            raise ValueError(f"Task '{task_name}': unsupported var type {var.type}")
+        try:
+            return coerce(value)
+        except TypeError as e:
+            raise self._type_error(task_name, var, value) from e
 
     def _type_error(self, task_name: str, var: TaskVar, value: Any) -> ValueError:
         got = type(value).__name__
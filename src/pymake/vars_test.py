@@ -7,10 +7,30 @@ from pathlib import Path
 
 import pytest
 
-from .task import TaskRegistry
+from .task import Task, TaskRegistry
 from .vars import VarsResolver, parse_vars_entry
 
 
+# Shared tasks for tests that only read them; resolvers never mutate a Task,
+# so each signature is inspected once per module instead of once per test
+def _deploy(env: str | None = None, port: int = 8080) -> None:
+    pass
+
+
+def _deploy_port(port: int = 8080) -> None:
+    pass
+
+
+@pytest.fixture(scope="module")
+def deploy_task() -> Task:
+    return TaskRegistry().register(_deploy, name="deploy")
+
+
+@pytest.fixture(scope="module")
+def deploy_port_task() -> Task:
+    return TaskRegistry().register(_deploy_port, name="deploy")
+
+
 def test_parse_vars_entry_dot_notation() -> None:
     task_name, var_name, value = parse_vars_entry("deploy.port=3000")
     assert task_name == "deploy"
@@ -35,6 +55,12 @@ def test_parse_vars_entry_bulk_requires_json_object() -> None:
         parse_vars_entry("deploy=123")
 
 
+@pytest.mark.parametrize("raw", ["prod", "", "[1]"])
+def test_parse_vars_entry_bulk_non_object_skips_json(raw: str) -> None:
+    with pytest.raises(ValueError, match="JSON object"):
+        parse_vars_entry(f"deploy={raw}")
+
+
 def test_resolve_defaults_only() -> None:
     registry = TaskRegistry()
 
@@ -46,7 +72,7 @@ def test_resolve_defaults_only() -> None:
     assert resolver.resolve(task) == {"env": None, "port": 8080, "dry_run": False}
 
 
-def test_resolve_vars_file_then_dot_override(tmp_path: Path) -> None:
+def test_resolve_vars_file_then_dot_override(tmp_path: Path, deploy_task: Task) -> None:
     vars_file = tmp_path / "prod.toml"
     vars_file.write_text(
         "\n".join(
@@ -58,12 +84,7 @@ def test_resolve_vars_file_then_dot_override(tmp_path: Path) -> None:
         )
     )
 
-    registry = TaskRegistry()
-
-    def deploy(env: str | None = None, port: int = 8080) -> None:
-        pass
-
-    task = registry.register(deploy)
+    task = deploy_task
     resolver = VarsResolver(
         vars_file=vars_file,
         vars_overrides=["deploy.port=9090"],
@@ -71,49 +92,56 @@ def test_resolve_vars_file_then_dot_override(tmp_path: Path) -> None:
     resolved = resolver.resolve(task)
     assert resolved == {"env": "production", "port": 9090}
 
+    # The cached file layer is copied, not handed out
+    resolved["env"] = "staging"
+    assert resolver.resolve(task) == {"env": "production", "port": 9090}
 
-def test_resolve_bulk_json_override() -> None:
-    registry = TaskRegistry()
 
-    def deploy(env: str | None = None, port: int = 8080) -> None:
-        pass
-
-    task = registry.register(deploy)
+def test_resolve_bulk_json_override(deploy_task: Task) -> None:
+    task = deploy_task
     resolver = VarsResolver(vars_overrides=['deploy={"env":"staging","port":3000}'])
     resolved = resolver.resolve(task)
     assert resolved == {"env": "staging", "port": 3000}
 
 
-def test_resolve_optional_null_from_bulk_json() -> None:
+def test_resolve_applies_only_own_overrides_in_order() -> None:
     registry = TaskRegistry()
 
-    def deploy(env: str | None = "staging") -> None:
+    def deploy(port: int = 8080) -> None:
         pass
 
-    task = registry.register(deploy)
-    resolver = VarsResolver(vars_overrides=['deploy={"env":null}'])
-    assert resolver.resolve(task) == {"env": None}
+    def serve(port: int = 80) -> None:
+        pass
 
+    deploy_only = registry.register(deploy)
+    serve_task = registry.register(serve)
+    resolver = VarsResolver(
+        vars_overrides=["deploy.port=1", "serve.port=2", 'deploy={"port":3}']
+    )
+    assert resolver.resolve(deploy_only) == {"port": 3}
+    assert resolver.resolve(serve_task) == {"port": 2}
 
-def test_unknown_var_name_raises() -> None:
+
+def test_resolve_optional_null_from_bulk_json() -> None:
     registry = TaskRegistry()
 
-    def deploy(port: int = 8080) -> None:
+    def deploy(env: str | None = "staging") -> None:
         pass
 
     task = registry.register(deploy)
+    resolver = VarsResolver(vars_overrides=['deploy={"env":null}'])
+    assert resolver.resolve(task) == {"env": None}
+
+
+def test_unknown_var_name_raises(deploy_port_task: Task) -> None:
+    task = deploy_port_task
     resolver = VarsResolver(vars_overrides=["deploy.nope=1"])
     with pytest.raises(ValueError, match="unknown var 'nope'"):
         resolver.resolve(task)
 
 
-def test_type_mismatch_in_bulk_json_raises() -> None:
-    registry = TaskRegistry()
-
-    def deploy(port: int = 8080) -> None:
-        pass
-
-    task = registry.register(deploy)
+def test_type_mismatch_in_bulk_json_raises(deploy_port_task: Task) -> None:
+    task = deploy_port_task
     resolver = VarsResolver(vars_overrides=['deploy={"port":"not-an-int"}'])
     with pytest.raises(ValueError, match="expected int"):
         resolver.resolve(task)
@@ -185,3 +213,8 @@ def test_validate_tasks_errors_on_unknown_task_in_override() -> None:
 
     with pytest.raises(ValueError, match="unknown task 'deploy'"):
         resolver.validate_tasks(registry.all_tasks())
+
+
+def test_missing_vars_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Vars file not found"):
+        VarsResolver(vars_file=tmp_path / "missing.toml")